@@ -0,0 +1,29 @@
+"""Add sample (project_id, sample_id) index
+
+Revision ID: c4f1a8d2e6b9
+Revises: e2a9c5d7f013
+Create Date: 2026-10-18 14:05:27.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a8d2e6b9'
+down_revision: Union[str, Sequence[str], None] = 'e2a9c5d7f013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_sample_project_id_sample_id', 'sample', ['project_id', 'sample_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sample_project_id_sample_id', table_name='sample')
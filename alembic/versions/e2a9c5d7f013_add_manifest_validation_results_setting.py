@@ -0,0 +1,54 @@
+"""Add manifest validation results setting
+
+Revision ID: e2a9c5d7f013
+Revises: b7c4e19f2a83
+Create Date: 2026-10-18 10:12:41.204113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9c5d7f013'
+down_revision: Union[str, Sequence[str], None] = 'b7c4e19f2a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    settings_table = sa.table('setting',
+        sa.column('key', sa.String),
+        sa.column('value', sa.String),
+        sa.column('name', sa.String),
+        sa.column('description', sa.String),
+        sa.column('tags', sa.JSON),
+    )
+    op.bulk_insert(settings_table, [
+        {
+            'key': 'MANIFEST_VALIDATION_RESULTS_URI',
+            'value': '',
+            'name': 'Manifest Validation Results URI',
+            'description': 'S3 prefix where asynchronous manifest validation results are written',
+            'tags': [
+                {'key': 'category', 'value': 'vendor settings'},
+                {'key': 'type', 'value': 'aws-s3'}
+            ]
+        }
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    settings_table = sa.table('setting',
+        sa.column('key', sa.String),
+        sa.column('value', sa.String),
+    )
+    op.execute(
+        settings_table.delete().where(
+            settings_table.c.key == 'MANIFEST_VALIDATION_RESULTS_URI'
+        )
+    )
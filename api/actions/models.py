@@ -4,6 +4,7 @@ Models for the Actions API
 
 from enum import Enum
 from typing import List, Dict, Any
+from pydantic import PrivateAttr
 from sqlmodel import SQLModel
 from api.jobs.models import AwsBatchConfig
 
@@ -35,6 +36,19 @@ class PlatformConfig(SQLModel):
     exports: List[Dict[str, str]] | None = None
     export_command: str | None = None
 
+    # Export label -> reference, flattened from ``exports`` once at load
+    _export_references: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Each export item maps one label to its reference; the first wins
+        for export_item in self.exports or []:
+            for label, value in export_item.items():
+                self._export_references.setdefault(label, value)
+
+    def export_reference(self, label: str) -> str | None:
+        """The reference value exported under ``label``, if any"""
+        return self._export_references.get(label)
+
 
 class ActionConfig(SQLModel):
     """Model for action workflow configuration."""
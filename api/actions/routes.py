@@ -1,8 +1,10 @@
 """Action API routes."""
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic_core import to_json
 
 from core.deps import SessionDep, get_s3_client
+from core.utils import etag_matches, make_etag
 from . import services
 from .models import ActionConfig, ActionConfigsResponse, SelectOption, ActionOption, ActionPlatform
 
@@ -68,63 +70,97 @@ def validate_action_config(
     )
 
 
+# The option lists only change with a deploy; let clients reuse them briefly
+# and revalidate cheaply with If-None-Match after that
+_OPTIONS_CACHE_CONTROL = "public, max-age=300"
+
+
+def _encode_options(options: list[SelectOption]) -> tuple[bytes, str]:
+    """JSON body and strong ETag for a constant list of options"""
+    body = to_json(options)
+    return body, make_etag(body)
+
+
+def _options_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve pre-encoded options, or an empty 304 when the client's copy is current"""
+    headers = {"ETag": etag, "Cache-Control": _OPTIONS_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# TODO: This shouldn't be hardcoded. I'm not quite sure how we want
+# to handle this but probably with a config setting.
+_ACTION_OPTIONS = [
+    SelectOption(
+        label="Create Project",
+        value="create-project",
+        description="Create a new project in one of the "
+        "supported platforms",
+    ),
+    SelectOption(
+        label="Export Project Results",
+        value="export-project-results",
+        description="Export the project results from one of the "
+        "supported platforms",
+    ),
+]
+_ACTION_OPTIONS_BODY, _ACTION_OPTIONS_ETAG = _encode_options(_ACTION_OPTIONS)
+
+# TODO: This shouldn't be hardcoded. We should read a list of
+# supported platforms from a config file or database.
+_ACTION_PLATFORMS = [
+    SelectOption(
+        label="Arvados",
+        value="Arvados",
+        description="Arvados platform",
+    ),
+    SelectOption(
+        label="SevenBridges",
+        value="SevenBridges",
+        description="SevenBridges platform",
+    ),
+]
+_ACTION_PLATFORMS_BODY, _ACTION_PLATFORMS_ETAG = _encode_options(_ACTION_PLATFORMS)
+
+
 @router.get(
     "/options",
     response_model=list[SelectOption],
     tags=["Action Endpoints"],
+    responses={304: {"description": "Options unchanged since the given ETag"}},
 )
-def get_action_options() -> list[SelectOption]:
+async def get_action_options(request: Request) -> Response:
     """
     Get available action options.
 
+    The list is constant, so it is encoded once at import and served with
+    an ETag; a request whose If-None-Match matches gets an empty 304.
+
     Returns:
         List of available action options with labels, values,
         and descriptions
     """
-    # TODO: This shouldn't be hardcoded. I'm not quite sure how we want
-    # to handle this but probably with a config setting.
-    return [
-        SelectOption(
-            label="Create Project",
-            value="create-project",
-            description="Create a new project in one of the "
-            "supported platforms",
-        ),
-        SelectOption(
-            label="Export Project Results",
-            value="export-project-results",
-            description="Export the project results from one of the "
-            "supported platforms",
-        ),
-    ]
+    return _options_response(request, _ACTION_OPTIONS_BODY, _ACTION_OPTIONS_ETAG)
 
 
 @router.get(
     "/platforms",
     response_model=list[SelectOption],
     tags=["Action Endpoints"],
+    responses={304: {"description": "Platforms unchanged since the given ETag"}},
 )
-def get_action_platforms() -> list[SelectOption]:
+async def get_action_platforms(request: Request) -> Response:
     """
     Get available action platforms.
 
+    The list is constant, so it is encoded once at import and served with
+    an ETag; a request whose If-None-Match matches gets an empty 304.
+
     Returns:
         List of available platforms with labels, values, and descriptions
     """
-    # TODO: This shouldn't be hardcoded. We should read a list of
-    # supported platforms from a config file or database.
-    return [
-        SelectOption(
-            label="Arvados",
-            value="Arvados",
-            description="Arvados platform",
-        ),
-        SelectOption(
-            label="SevenBridges",
-            value="SevenBridges",
-            description="SevenBridges platform",
-        ),
-    ]
+    return _options_response(request, _ACTION_PLATFORMS_BODY, _ACTION_PLATFORMS_ETAG)
 
 
 @router.get(
@@ -1,14 +1,29 @@
 """Action API services."""
 
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
 from botocore.exceptions import ClientError, NoCredentialsError
 from fastapi import HTTPException, status
 from sqlmodel import Session
 
 from api.settings.services import get_setting_value
+from core.cache import TTLCache
+from core.config import get_settings
+from core.deps import get_aws_client
 from .models import ActionConfig, ActionConfigsResponse
 
+# Config listings and parsed configs keyed by (bucket, prefix[, action_id]).
+# The YAML in S3 changes rarely, so serving it from memory for
+# WORKFLOW_CONFIG_CACHE_TTL seconds saves a LIST plus one GET per config.
+_action_config_cache = TTLCache(maxsize=256)
+_CACHE_MISS = object()
+
+# Concurrent GETs when loading every config. The shared S3 client pools 64
+# connections (core.deps.get_aws_client_config); 8 overlaps the handful of
+# config GETs while leaving most of the pool to other in-flight requests
+ACTION_CONFIG_FETCH_WORKERS = 8
+
 
 def _get_action_configs_s3_location(session: Session) -> tuple[str, str]:
     """
@@ -49,16 +64,32 @@ def list_action_configs(session: Session, s3_client=None) -> list[str]:
         List of action configuration filenames (without .yaml extension)
     """
     bucket, prefix = _get_action_configs_s3_location(session)
+    return list(_list_action_config_keys(bucket, prefix, s3_client))
+
+
+def _list_action_config_keys(
+    bucket: str, prefix: str, s3_client=None
+) -> dict[str, str]:
+    """
+    Map each listed action_id to the S3 key of its config, in action_id order.
+
+    Where both a .yaml and a .yml file exist the .yaml one is used, matching
+    the order _load_action_config probes them in.
+    """
+    cache_key = (bucket, prefix)
+    cached = _action_config_cache.get(cache_key, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        return dict(cached)
 
     try:
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         # List objects in the bucket/prefix
         paginator = s3_client.get_paginator("list_objects_v2")
         page_iterator = paginator.paginate(Bucket=bucket, Prefix=prefix)
 
-        action_configs = []
+        action_configs = {}
 
         for page in page_iterator:
             for obj in page.get("Contents", []):
@@ -73,11 +104,16 @@ def list_action_configs(session: Session, s3_client=None) -> list[str]:
 
                 # Only include .yaml or .yml files
                 if filename.endswith((".yaml", ".yml")):
-                    # Remove extension and add to list
+                    # Remove extension and remember the key it was found under
                     action_id = filename.rsplit(".", 1)[0]
-                    action_configs.append(action_id)
+                    if filename.endswith(".yaml") or action_id not in action_configs:
+                        action_configs[action_id] = key
 
-        return sorted(action_configs)
+        action_configs = dict(sorted(action_configs.items()))
+        _action_config_cache.set(
+            cache_key, tuple(action_configs.items()), get_settings().WORKFLOW_CONFIG_CACHE_TTL
+        )
+        return action_configs
 
     except NoCredentialsError as exc:
         raise HTTPException(
@@ -119,15 +155,37 @@ def get_action_config(
     """
 
     bucket, prefix = _get_action_configs_s3_location(session)
+    return _load_action_config(bucket, prefix, action_id, s3_client)
+
+
+def _load_action_config(
+    bucket: str, prefix: str, action_id: str, s3_client=None, object_key: str | None = None
+) -> ActionConfig:
+    """
+    Cached read of one action config from a resolved bucket/prefix.
+
+    Does not touch the database session, so get_all_action_configs can run
+    it from worker threads. object_key is the config's S3 key when a listing
+    has already found it; otherwise the .yaml and .yml keys are probed.
+    """
+    cache_key = (bucket, prefix, action_id)
+    cached = _action_config_cache.get(cache_key, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        return cached.model_copy(deep=True)
 
     try:
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
+
+        if object_key is not None:
+            # Listed already, so one GET of the known key
+            candidate_keys = [object_key]
+        else:
+            # Try both .yaml and .yml extensions
+            candidate_keys = [f"{prefix}{action_id}{ext}" for ext in [".yaml", ".yml"]]
 
-        # Try both .yaml and .yml extensions
         key = None
-        for ext in [".yaml", ".yml"]:
-            potential_key = f"{prefix}{action_id}{ext}"
+        for potential_key in candidate_keys:
             try:
                 response = s3_client.get_object(Bucket=bucket, Key=potential_key)
                 key = potential_key
@@ -153,7 +211,11 @@ def get_action_config(
         config_data["workflow_id"] = action_id
 
         # Validate and return as ActionConfig model
-        return ActionConfig(**config_data)
+        config = ActionConfig(**config_data)
+        _action_config_cache.set(
+            cache_key, config.model_copy(deep=True), get_settings().WORKFLOW_CONFIG_CACHE_TTL
+        )
+        return config
 
     except HTTPException:
         raise
@@ -200,23 +262,31 @@ def get_all_action_configs(
         ActionConfigsResponse with list of all configs
     """
 
-    # Get list of action IDs
-    action_ids = list_action_configs(session=session, s3_client=s3_client)
+    # Get the action IDs, with the key each was listed under
+    bucket, prefix = _get_action_configs_s3_location(session)
+    action_keys = _list_action_config_keys(bucket, prefix, s3_client)
+    action_ids = list(action_keys)
+    if s3_client is None:
+        s3_client = get_aws_client("s3")
 
-    # Fetch and parse each config
-    configs = []
-    for action_id in action_ids:
+    def load(action_id: str) -> ActionConfig | None:
         try:
-            config = get_action_config(
-                session=session,
-                action_id=action_id,
-                s3_client=s3_client
+            return _load_action_config(
+                bucket, prefix, action_id, s3_client, object_key=action_keys[action_id]
             )
-            configs.append(config)
         except HTTPException:
-            # Log but continue with other configs
-            # Could add logging here
-            continue
+            # Skip unreadable configs and continue with the others
+            return None
+
+    # Fetch and parse the configs concurrently (boto3 clients are thread-safe),
+    # so wall time is roughly one GET rather than one per config
+    if len(action_ids) > 1:
+        workers = min(ACTION_CONFIG_FETCH_WORKERS, len(action_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(load, action_ids))
+    else:
+        loaded = [load(action_id) for action_id in action_ids]
+    configs = [config for config in loaded if config is not None]
 
     return ActionConfigsResponse(
         configs=configs,
@@ -335,7 +405,7 @@ def validate_action_config(
 
     try:
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         # Fetch file from S3
         response = s3_client.get_object(Bucket=bucket, Key=key)
@@ -37,9 +37,10 @@ from api.files.models import (
     FileBrowserFolder,
 )
 from api.samples.services import resolve_or_create_sample
+from core.deps import get_aws_client
 
 try:
-    import boto3
+    import boto3  # noqa: F401 - availability check; clients come from get_aws_client
     from botocore.exceptions import NoCredentialsError, ClientError
 
     BOTO3_AVAILABLE = True
@@ -778,7 +779,7 @@ def _upload_to_s3(
         bucket, key = _parse_s3_path(s3_uri)
 
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         # Check if object exists when overwrite is not allowed
         if not allow_overwrite:
@@ -945,7 +946,7 @@ def download_file(s3_path: str, s3_client=None) -> tuple[bytes, str, str]:
             )
 
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         response = s3_client.get_object(Bucket=bucket, Key=key)
         file_content = response['Body'].read()
@@ -1027,7 +1028,7 @@ def generate_presigned_url(
             )
 
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         presigned_url = s3_client.generate_presigned_url(
             "get_object",
@@ -1097,7 +1098,7 @@ def list_s3_files(uri: str, s3_client=None) -> FileBrowserData:
         bucket, prefix = _parse_s3_path(uri)
 
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         paginator = s3_client.get_paginator("list_objects_v2")
         page_iterator = paginator.paginate(
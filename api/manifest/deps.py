@@ -0,0 +1,42 @@
+"""
+Manifest dependencies for dependency injection
+"""
+
+from typing import Annotated
+from fastapi import Depends, HTTPException, Query, status
+
+from api.manifest.models import S3Path, parse_s3_path
+
+
+def get_validated_s3_path(
+    s3_path: str = Query(
+        ..., description="S3 path (e.g., s3://bucket-name/path/to/manifests)"
+    ),
+) -> S3Path:
+    """
+    Dependency that parses and validates an ``s3_path`` query parameter.
+
+    Malformed paths are rejected with a 400 before any S3 client is created
+    or called, and the parsed bucket/key travel with the returned value so
+    services do not parse the path again.
+
+    Args:
+        s3_path: The S3 path from the query string
+
+    Returns:
+        S3Path with ``bucket`` and ``key`` populated
+
+    Raises:
+        HTTPException: 400 if the path is not a valid S3 path
+    """
+    try:
+        return parse_s3_path(s3_path)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+
+# Type alias for clean usage in route signatures
+S3PathDep = Annotated[S3Path, Depends(get_validated_s3_path)]
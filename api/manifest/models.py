@@ -1,10 +1,59 @@
 """
 Models for the Manifest API
 """
-from typing import Optional
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
+# Well-formed s3://bucket[/key] paths; anything else falls through to the
+# step-by-step checks in S3Path so callers get a specific error message
+_S3_PATH_RE = re.compile(r"s3://(?P<bucket>[^/]+)(?:/(?P<key>.*))?", re.DOTALL)
+
+
+class S3Path(str):
+    """An s3://bucket/key string whose bucket and key are parsed once"""
+
+    bucket: str
+    key: str
+
+    def __new__(cls, value: str) -> "S3Path":
+        match = _S3_PATH_RE.fullmatch(value)
+        if match is None or "//" in value[5:]:
+            cls._raise_invalid(value)
+
+        obj = super().__new__(cls, value)
+        obj.bucket = match["bucket"]
+        obj.key = match["key"] or ""
+        return obj
+
+    @staticmethod
+    def _raise_invalid(value: str) -> None:
+        """Raise a ValueError describing why value is not a valid S3 path"""
+        if not value.startswith("s3://"):
+            raise ValueError("Invalid S3 path format. Must start with s3://")
+
+        path_without_scheme = value[5:]
+        if not path_without_scheme:
+            raise ValueError("Invalid S3 path format. Bucket name is required")
+        if path_without_scheme.startswith("/"):
+            raise ValueError("Invalid S3 path format. Bucket name cannot start with /")
+        raise ValueError("Invalid S3 path format. Path cannot contain double slashes")
+
+
+@lru_cache(maxsize=1024)
+def parse_s3_path(value: str) -> S3Path:
+    """
+    Memoized S3Path(value).
+
+    The same few bucket/prefix strings arrive on every request, so parsed
+    paths are reused; S3Path instances are never mutated after creation.
+    Invalid paths raise ValueError as S3Path does (and are not cached).
+    """
+    return S3Path(value)
+
 
 class ManifestUploadResponse(BaseModel):
     """Response model for manifest file upload"""
@@ -39,3 +88,24 @@ class ManifestValidationResponse(BaseModel):
         default=None,
         description="Error message if posting samples failed"
     )
+
+
+class ManifestValidationJob(BaseModel):
+    """Response model for an asynchronous (fire-and-forget) manifest validation"""
+
+    job_id: str = Field(..., description="Identifier used to poll for the result")
+    status: Literal["pending", "complete", "failed"] = Field(
+        ..., description="Whether the validation result is available yet"
+    )
+    result_uri: str = Field(..., description="S3 path the validation result is written to")
+    submitted_at: Optional[datetime] = Field(
+        default=None, description="When the validation was queued"
+    )
+    result: Optional[ManifestValidationResponse] = Field(
+        default=None,
+        description="Validation result, once status is complete"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Why the validation could not run, once status is failed"
+    )
@@ -3,23 +3,39 @@ Routes/endpoints for the Manifest API
 """
 
 from typing import Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Response, status, UploadFile, File
+from fastapi.responses import PlainTextResponse
 from api.manifest import services
-from api.manifest.models import ManifestUploadResponse, ManifestValidationResponse
+from api.manifest.deps import S3PathDep
+from api.manifest.models import (
+    ManifestUploadResponse,
+    ManifestValidationJob,
+    ManifestValidationResponse,
+)
 from core.deps import get_s3_client, SessionDep
 
 
 router = APIRouter(prefix="/manifest", tags=["Manifest Endpoints"])
 
 
-@router.get("", response_model=str, tags=["Manifest Endpoints"])
+@router.get(
+    "",
+    response_class=PlainTextResponse,
+    response_model=None,
+    responses={204: {"description": "No manifest found"}},
+    tags=["Manifest Endpoints"],
+)
 def get_latest_manifest(
-    s3_path: str = Query(
-        ..., description="S3 bucket path to search for manifest files"
+    s3_path: S3PathDep,
+    date_pattern: Optional[str] = Query(
+        None,
+        description="strftime pattern of date-named sub-prefixes (e.g. '%Y/%m/%d/'); "
+                    "recent dates are searched newest first",
     ),
     s3_client=Depends(get_s3_client),
-) -> str:
+) -> Response | str:
     """
     Retrieve the latest manifest file path from the specified S3 bucket.
 
@@ -31,11 +47,16 @@ def get_latest_manifest(
 
     Args:
         s3_path: S3 path to search (e.g., "s3://bucket-name/path/to/manifests")
+        date_pattern: Optional strftime pattern for date-organized layouts,
+            letting the search stop at the most recent date with a manifest
 
     Returns:
-        Full S3 path to the latest manifest file
+        Full S3 path to the latest manifest file as plain text, or an empty
+        204 response if no manifest matches
     """
-    manifest_path = services.get_latest_manifest_file(s3_path, s3_client)
+    manifest_path = services.get_latest_manifest_file(
+        s3_path, s3_client, date_pattern=date_pattern
+    )
 
     if manifest_path is None:
         # Return 204 No Content if no manifest found
@@ -51,9 +72,7 @@ def get_latest_manifest(
     tags=["Manifest Endpoints"],
 )
 def upload_manifest(
-    s3_path: str = Query(
-        ..., description="S3 path where the manifest file should be uploaded"
-    ),
+    s3_path: S3PathDep,
     file: UploadFile = File(..., description="Manifest CSV file to upload"),
     s3_client=Depends(get_s3_client),
 ) -> ManifestUploadResponse:
@@ -77,7 +96,7 @@ def upload_manifest(
     response_model=ManifestValidationResponse,
     tags=["Manifest Endpoints"],
 )
-def validate_manifest(
+async def validate_manifest(
     session: SessionDep,
     manifest_uri: str = Query(
         ..., description="(S3, GS) path to the manifest CSV file to validate"
@@ -114,7 +133,7 @@ def validate_manifest(
     if manifest_version:
         manifest_version = manifest_version.upper()
 
-    result = services.validate_manifest_file(
+    result = await services.validate_manifest_file_async(
         session=session,
         manifest_uri=manifest_uri,
         files_uri=files_uri,
@@ -122,3 +141,82 @@ def validate_manifest(
         post_to_api=post_to_api,
     )
     return result
+
+
+# The /validations endpoints depend on the validation Lambda writing its
+# result to the result_uri it is given; they stay out of the OpenAPI schema
+# until the deployed Lambda does so.
+@router.post(
+    "/validations",
+    response_model=ManifestValidationJob,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Manifest Endpoints"],
+    include_in_schema=False,
+)
+def submit_manifest_validation(
+    session: SessionDep,
+    manifest_uri: str = Query(
+        ..., description="(S3, GS) path to the manifest CSV file to validate"
+    ),
+    manifest_version: Optional[str] = Query(
+        None, description="Manifest version to validate against (e.g., 'DTS12.1')"
+    ),
+    files_uri: str = Query(
+        None, description="(S3, GS) path where files described in manifest are located "
+                          "(e.g. s3://vendorbucket/path/to/files/)"
+    ),
+    post_to_api: Optional[bool] = Query(
+        False, description="If true, post samples to API after successful validation"
+    ),
+    s3_client=Depends(get_s3_client),
+) -> ManifestValidationJob:
+    """
+    Queue a manifest validation and return immediately.
+
+    Use this instead of /manifest/validate for large manifests whose
+    validation may outlast the HTTP request. Poll
+    /manifest/validations/{job_id} for the result.
+
+    A "submitted" marker is written to result_uri under
+    MANIFEST_VALIDATION_RESULTS_URI, and the Lambda receives job_id and
+    result_uri in its event. The Lambda must write its usual response JSON
+    to result_uri when it finishes.
+
+    Returns:
+        ManifestValidationJob with the job_id to poll
+    """
+    if manifest_version:
+        manifest_version = manifest_version.upper()
+
+    return services.submit_manifest_validation(
+        session=session,
+        manifest_uri=manifest_uri,
+        files_uri=files_uri,
+        manifest_version=manifest_version,
+        post_to_api=post_to_api,
+        s3_client=s3_client,
+    )
+
+
+@router.get(
+    "/validations/{job_id}",
+    response_model=ManifestValidationJob,
+    tags=["Manifest Endpoints"],
+    include_in_schema=False,
+)
+def get_manifest_validation(
+    session: SessionDep,
+    job_id: UUID,
+    s3_client=Depends(get_s3_client),
+) -> ManifestValidationJob:
+    """
+    Retrieve the status of a queued manifest validation.
+
+    Returns:
+        ManifestValidationJob; status is "pending" until the validation
+        result is available, then "complete", or "failed" with the error
+        if the Lambda reported one or never wrote a result
+    """
+    return services.get_manifest_validation_job(
+        session=session, job_id=str(job_id), s3_client=s3_client
+    )
@@ -31,6 +31,9 @@ def create_pipeline(
     created_by: str,
 ) -> Pipeline:
     """Create a pipeline with optional attributes and workflow links."""
+    # Reject duplicate attribute keys before touching the database
+    check_duplicate_attribute_keys(pipeline_in.attributes or [], "pipeline attributes")
+
     pipeline = Pipeline(
         name=pipeline_in.name,
         version=pipeline_in.version,
@@ -42,10 +45,6 @@ def create_pipeline(
 
     # Handle attributes
     if pipeline_in.attributes:
-        check_duplicate_attribute_keys(
-            pipeline_in.attributes, "pipeline attributes"
-        )
-
         attrs = [
             PipelineAttribute(
                 pipeline_id=pipeline.id, key=attr.key, value=attr.value
@@ -4,6 +4,7 @@ Project dependencies for dependency injection
 
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from core.deps import SessionDep
@@ -17,6 +18,9 @@ def get_validated_project(
     """
     Dependency that validates a project exists and returns the database object.
 
+    Attributes are eager-loaded in the same round trip so routes reading
+    project.attributes don't trigger a lazy load.
+
     Args:
         project_id: The project ID from the path parameter
         session: Database session
@@ -28,7 +32,9 @@ def get_validated_project(
         HTTPException: 404 if project not found
     """
     project = session.exec(
-        select(Project).where(Project.project_id == project_id)
+        select(Project)
+        .options(selectinload(Project.attributes))
+        .where(Project.project_id == project_id)
     ).first()
 
     if not project:
@@ -40,5 +46,5 @@ def get_validated_project(
     return project
 
 
-# Type alias for clean usage in route signatures
+# Type aliases for clean usage in route signatures
 ProjectDep = Annotated[Project, Depends(get_validated_project)]
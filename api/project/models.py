@@ -95,9 +95,12 @@ class ProjectPublic(SQLModel):
 
 class ProjectsPublic(SQLModel):
     data: List[ProjectPublic]
-    total_items: int
-    total_pages: int
-    current_page: int
+    # Not computed for cursor (keyset) pages
+    total_items: int | None
+    total_pages: int | None
+    current_page: int | None
     per_page: int
     has_next: bool
     has_prev: bool
+    # Set when there is a next page of a listing sorted by project_id or name
+    next_cursor: str | None = None
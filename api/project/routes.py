@@ -3,8 +3,18 @@ Routes/endpoints for the Project API
 """
 
 from typing import Literal, List as TypingList
-from fastapi import APIRouter, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from core.deps import SessionDep, OpenSearchDep, S3ClientDep
+from core.utils import etag_matches, make_etag
 from api.auth.deps import CurrentUser, CurrentSuperuser
 from api.jobs.models import BatchJobPublic
 from api.project.deps import ProjectDep
@@ -44,7 +54,8 @@ def create_project(
     session: SessionDep,
     opensearch_client: OpenSearchDep,
     project_in: ProjectCreate,
-    current_user: CurrentUser
+    current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
 ) -> ProjectPublic:
     """
     Create a new project with optional attributes.
@@ -53,6 +64,7 @@ def create_project(
         session=session,
         project_in=project_in,
         current_user=current_user.username,
+        background_tasks=background_tasks,
         opensearch_client=opensearch_client
     )
 
@@ -67,13 +79,25 @@ def get_projects(
     session: SessionDep,
     page: int = Query(1, description="Page number (1-indexed)"),
     per_page: int = Query(20, description="Number of items per page"),
-    sort_by: str = Query("project_id", description="Field to sort by"),
+    sort_by: Literal[
+        "project_id", "name", "created_at", "created_by", "last_modified"
+    ] = Query("project_id", description="Field to sort by"),
     sort_order: Literal["asc", "desc"] = Query(
         "asc", description="Sort order (asc or desc)"
     ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor from a previous page; continues after it using "
+                    "keyset pagination (page is ignored, requires sort_by=project_id "
+                    "or name)",
+    ),
 ) -> ProjectsPublic:
     """
     Returns a paginated list of projects.
+
+    Pages can be addressed by number (``page``) or, for deep listings, by
+    following ``next_cursor`` with ``cursor``; cursor pages skip the total
+    count and do not slow down with depth.
     """
     return services.get_projects(
         session=session,
@@ -81,6 +105,7 @@ def get_projects(
         per_page=per_page,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
     )
 
 
@@ -127,9 +152,17 @@ def search_projects(
     sort_order: Literal["asc", "desc"] | None = Query(
         "asc", description="Sort order (asc or desc)"
     ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor from a previous page; continues after it using "
+                    "search_after (page is ignored)",
+    ),
 ) -> ProjectsPublic:
     """
     Search projects by project_id or name.
+
+    Follow ``next_cursor`` with ``cursor`` to page deep into large result
+    sets without the cost of from/size pagination.
     """
     return services.search_projects(
         session=session,
@@ -139,6 +172,7 @@ def search_projects(
         per_page=per_page,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
     )
 
 
@@ -165,14 +199,28 @@ def reindex_projects(
 @router.get(
     "/{project_id}",
     response_model=ProjectPublic,
-    tags=["Project Endpoints"]
+    tags=["Project Endpoints"],
+    responses={304: {"description": "Project unchanged since the given ETag"}},
 )
-def get_project_by_project_id(session: SessionDep, project: ProjectDep) -> ProjectPublic:
+def get_project_by_project_id(
+    request: Request, session: SessionDep, project: ProjectDep
+) -> Response:
     """
     Returns a single project by its project_id.
     Note: This is different from its internal "id".
+
+    The response carries an ETag of its body; a request whose If-None-Match
+    matches gets an empty 304 instead. The tag covers the project's runs
+    and folder URIs too, which can change without touching last_modified.
     """
-    return services.get_project_by_project_id(session=session, project_id=project.project_id)
+    body = services.get_project_by_project_id(
+        session=session, project=project
+    ).model_dump_json().encode()
+    etag = make_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.put(
@@ -185,7 +233,8 @@ def update_project(
     session: SessionDep,
     opensearch_client: OpenSearchDep,
     project: ProjectDep,
-    update_request: ProjectUpdate
+    update_request: ProjectUpdate,
+    background_tasks: BackgroundTasks,
 ) -> ProjectPublic:
     """
     Full replacement update of a project.
@@ -197,8 +246,9 @@ def update_project(
     return services.update_project(
         session=session,
         opensearch_client=opensearch_client,
-        project_id=project.project_id,
+        project=project,
         update_request=update_request,
+        background_tasks=background_tasks,
     )
 
 
@@ -213,6 +263,7 @@ def patch_project(
     opensearch_client: OpenSearchDep,
     project: ProjectDep,
     update_request: ProjectUpdate,
+    background_tasks: BackgroundTasks,
 ) -> ProjectPublic:
     """
     Partially update a project using merge/upsert semantics.
@@ -225,8 +276,9 @@ def patch_project(
     return services.patch_project(
         session=session,
         opensearch_client=opensearch_client,
-        project_id=project.project_id,
+        project=project,
         update_request=update_request,
+        background_tasks=background_tasks,
     )
 
 ###############################################################################
@@ -246,6 +298,7 @@ def add_sample_to_project(
     project: ProjectDep,
     sample_in: SampleCreate,
     current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
 ) -> SamplePublic:
     """
     Create a new sample with optional attributes.
@@ -258,6 +311,7 @@ def add_sample_to_project(
         opensearch_client=opensearch_client,
         project=project,
         sample_in=sample_in,
+        background_tasks=background_tasks,
         created_by=current_user.username,
     )
     return SamplePublic(
@@ -277,12 +331,13 @@ def add_sample_to_project(
     status_code=status.HTTP_201_CREATED,
     response_model=BulkSampleCreateResponse,
 )
-async def upload_samples_file(
+def upload_samples_file(
     session: SessionDep,
     opensearch_client: OpenSearchDep,
     project: ProjectDep,
     current_user: CurrentUser,
     file: UploadFile,
+    background_tasks: BackgroundTasks,
 ) -> BulkSampleCreateResponse:
     """
     Upload a CSV/TSV file to create or update samples in bulk.
@@ -299,10 +354,12 @@ async def upload_samples_file(
 
     # Validate content type / extension
     filename = file.filename or ""
-    content = await file.read()
 
     try:
-        samples_in = parse_sample_file(file_content=content, filename=filename)
+        # Parse straight from the spooled upload rather than copying it into
+        # memory first. The route is sync, so the reads (from disk for large
+        # uploads) and the database work run in the threadpool, not the loop
+        samples_in = parse_sample_file(file_content=file.file, filename=filename)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -315,6 +372,7 @@ async def upload_samples_file(
         project=project,
         samples_in=samples_in,
         created_by=current_user.username,
+        background_tasks=background_tasks,
     )
 
 
@@ -330,6 +388,7 @@ def bulk_create_samples(
     project: ProjectDep,
     current_user: CurrentUser,
     body: BulkSampleCreateRequest,
+    background_tasks: BackgroundTasks,
 ) -> BulkSampleCreateResponse:
     """
     Create multiple samples in a single atomic transaction.
@@ -344,6 +403,7 @@ def bulk_create_samples(
         project=project,
         samples_in=body.samples,
         created_by=current_user.username,
+        background_tasks=background_tasks,
     )
 
 
@@ -359,7 +419,9 @@ def get_project_samples(
     limit: int = Query(
         100, ge=1, le=10000, description="Maximum number of records to return"
     ),
-    sort_by: str = Query("sample_id", description="Field to sort by"),
+    sort_by: Literal["sample_id", "created_at", "updated_at"] = Query(
+        "sample_id", description="Field to sort by"
+    ),
     sort_order: Literal["asc", "desc"] = Query(
         "asc", description="Sort order (asc or desc)"
     ),
@@ -374,13 +436,20 @@ def get_project_samples(
             "'all' returns every version."
         ),
     ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor from a previous page; continues after it using "
+                    "keyset pagination (skip is ignored, requires sort_by=sample_id)",
+    ),
 ) -> SamplesWithFilesPublic | SamplesPublic:
     """
     Returns a list of samples for a project.
 
     Pagination is offset-based: ``skip`` is the number of records to skip
-    and ``limit`` caps the page size. Pass ``?include=files`` to eagerly
-    load file metadata for each sample.
+    and ``limit`` caps the page size. For deep listings, follow
+    ``next_cursor`` with ``cursor`` instead; cursor pages skip the total
+    count and do not slow down with depth. Pass ``?include=files`` to
+    eagerly load file metadata for each sample.
 
     By default only the latest version of each file (by URI) is returned.
     Pass ``?file_versions=all`` to include all versions.
@@ -394,6 +463,7 @@ def get_project_samples(
         sort_order=sort_order,
         include=include,
         file_versions=file_versions,
+        cursor=cursor,
     )
 
 
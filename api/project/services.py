@@ -4,25 +4,32 @@ Services for the Project API
 
 from datetime import datetime, timezone as tz
 from typing import Literal
-import boto3
+import json
 import logging
 
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from api.utils import check_duplicate_attribute_keys
 from pydantic import PositiveInt, ValidationError
 from pytz import timezone
-from sqlmodel import Session, func, select
+from sqlmodel import Session, delete, func, select
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import (
+    ConnectionError as OpenSearchConnectionError,
+    OpenSearchException,
+)
 import yaml
 
 from api.jobs.models import BatchJob, VendorIngestionConfig
-from api.settings.services import get_setting, get_setting_value
+from api.settings.services import get_cached_setting_value, get_setting
 from api.actions.services import get_all_action_configs
 from api.actions.models import ActionOption, ActionPlatform
 from api.jobs.services import submit_batch_job
 
-from core.utils import define_search_body, interpolate
+from core.deps import get_aws_client
+from core.utils import decode_cursor, define_search_body, encode_cursor, interpolate
 
 from api.project.models import (
     Project,
@@ -34,7 +41,11 @@ from api.project.models import (
 )
 from api.search.models import SearchDocument
 from api.search.services import (
-    add_object_to_index, add_objects_to_index, reset_index
+    REINDEX_YIELD_PER,
+    add_object_to_index_later,
+    add_objects_to_index,
+    bulk_load_index,
+    reset_index,
 )
 from api.samples.models import (
     Sample,
@@ -47,10 +58,27 @@ from api.samples.models import (
     SampleFilePublic,
     Attribute,
 )
+from api.samples.services import SAMPLE_SORT_COLUMNS, sample_data_cols
 from api.runs.models import SequencingRun, SequencingRunPublic, SampleSequencingRun
 
 logger = logging.getLogger(__name__)
 
+# Columns project listings may be sorted by
+PROJECT_SORT_COLUMNS = {
+    "project_id": Project.project_id,
+    "name": Project.name,
+    "created_at": Project.created_at,
+    "created_by": Project.created_by,
+    "last_modified": Project.last_modified,
+}
+
+# Sort fields get_projects can page through with a keyset cursor
+KEYSET_SORT_FIELDS = ("project_id", "name")
+
+# How many project_ids create_project tries before giving up when concurrent
+# creates keep taking the one it generated
+PROJECT_ID_ATTEMPTS = 5
+
 
 def generate_project_id(*, session: Session) -> str:
     """
@@ -62,46 +90,71 @@ def generate_project_id(*, session: Session) -> str:
     now = datetime.now(timezone("US/Eastern"))
     prefix = f"P-{now:%Y%m%d}-"
 
-    # Find last project with today's date
-    project = session.exec(
-        select(Project)
+    # Find the last project_id with today's date; a scalar MAX over the
+    # unique project_id index, without loading the project itself
+    last_project_id = session.exec(
+        select(func.max(Project.project_id))
         .where(Project.project_id.like(f"{prefix}%"))
-        .order_by(Project.project_id.desc())
-        .limit(1)
-    ).one_or_none()
+    ).one()
 
-    if not project:
+    if not last_project_id:
         return f"{prefix}0001"
 
+    return _next_project_id(last_project_id)
+
+
+def _next_project_id(project_id: str) -> str:
+    """
+    The project_id following the given one on the same day
+    """
     # Increment the suffix (part after the second hyphen)
-    suffix = int(project.project_id.split("-")[2]) + 1
-    return f"{prefix}{suffix:04d}"
+    prefix, _, suffix = project_id.rpartition("-")
+    return f"{prefix}-{int(suffix) + 1:04d}"
 
 
 def create_project(
     session: Session,
     project_in: ProjectCreate,
     current_user: str,
+    background_tasks: BackgroundTasks,
     opensearch_client: OpenSearch = None
 ) -> ProjectPublic:
     """
     Create a new project with optional attributes.
+
+    The project is indexed into OpenSearch after the response is sent.
     """
-    # Create initial project
-    project = Project(
-        project_id=generate_project_id(session=session),
-        name=project_in.name,
-        created_by=current_user
-    )
-    session.add(project)
-    session.flush()
+    # Reject duplicate attribute keys before touching the database
+    check_duplicate_attribute_keys(project_in.attributes or [], "project attributes")
+
+    # Create initial project. Two concurrent creates can read the same
+    # highest project_id, and the unique constraint rejects the slower one;
+    # it then moves on to the next suffix inside a savepoint. The suffix is
+    # stepped rather than regenerated, as a repeatable-read snapshot would
+    # keep returning the same maximum.
+    project_id = generate_project_id(session=session)
+    for _ in range(PROJECT_ID_ATTEMPTS):
+        project = Project(
+            project_id=project_id,
+            name=project_in.name,
+            created_by=current_user
+        )
+        try:
+            with session.begin_nested():
+                session.add(project)
+            break
+        except IntegrityError:
+            logger.info("Project ID %s was taken concurrently, retrying", project_id)
+            project_id = _next_project_id(project_id)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Could not allocate a project ID, please retry",
+        )
 
     # Handle attribute mapping
+    project_attributes = []
     if project_in.attributes:
-        check_duplicate_attribute_keys(
-            project_in.attributes, "project attributes"
-        )
-
         # Parse and create project attributes
         # linking to new project
         project_attributes = [
@@ -112,19 +165,48 @@ def create_project(
         # Update database with attribute links
         session.add_all(project_attributes)
 
-    # With orm_mode=True, attributes will be eagerly loaded
-    # and mapped to ProjectPublic via response model
-    session.commit()
-    session.refresh(project)
+    data_bucket, results_bucket = _bucket_uris(session)
+
+    # Build the response from the rows just written, rather than refreshing
+    # the project and lazy-loading its attributes back after the commit (the
+    # update/patch paths below do the same). No sequencing runs exist yet.
+    project_public = _project_public(
+        project, project_attributes, data_bucket, results_bucket
+    )
 
-    # Add project to opensearch
+    # Add project to opensearch once the commit has succeeded and the
+    # response is on its way
     if opensearch_client:
-        search_doc = SearchDocument(id=project.project_id, body=project)
-        add_object_to_index(opensearch_client, search_doc, index="projects")
+        search_doc = SearchDocument(id=project_public.project_id, body=project)
+        add_object_to_index_later(
+            background_tasks, opensearch_client, search_doc, index="projects"
+        )
+
+    session.commit()
+
+    return project_public
+
 
-    data_bucket = get_setting_value(session, "DATA_BUCKET_URI")
-    results_bucket = get_setting_value(session, "RESULTS_BUCKET_URI")
+def _bucket_uris(session: Session) -> tuple[str | None, str | None]:
+    """
+    DATA_BUCKET_URI and RESULTS_BUCKET_URI, the roots of every project's
+    folder URIs. Read through the settings cache, as every project response
+    needs them.
+    """
+    return (
+        get_cached_setting_value(session, "DATA_BUCKET_URI"),
+        get_cached_setting_value(session, "RESULTS_BUCKET_URI"),
+    )
 
+
+def _project_public(
+    project: Project,
+    attributes,
+    data_bucket: str | None,
+    results_bucket: str | None,
+    sequencing_runs: list[SequencingRunPublic] | None = None,
+) -> ProjectPublic:
+    """Build a ProjectPublic, deriving the folder URIs from the bucket roots"""
     return ProjectPublic(
         project_id=project.project_id,
         name=project.name,
@@ -133,11 +215,42 @@ def create_project(
         last_modified=project.last_modified,
         data_folder_uri=f"{data_bucket}/{project.project_id}/",
         results_folder_uri=f"{results_bucket}/{project.project_id}/",
-        attributes=project.attributes,
-        sequencing_runs=None  # No sequencing runs at time of project creation
+        attributes=attributes,
+        sequencing_runs=sequencing_runs,
     )
 
 
+def _decode_cursor_or_400(cursor: str) -> str:
+    """Decode a pagination cursor, mapping malformed cursors to a 400"""
+    try:
+        return decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+
+
+def _encode_keyset_cursor(project: Project, sort_by: str) -> str:
+    """Cursor continuing a get_projects listing after project"""
+    if sort_by == "project_id":
+        return encode_cursor(project.project_id)
+    return encode_cursor(json.dumps([getattr(project, sort_by), project.project_id]))
+
+
+def _decode_keyset_cursor(cursor: str, sort_by: str) -> tuple:
+    """The sort key encoded by _encode_keyset_cursor, or a 400"""
+    value = _decode_cursor_or_400(cursor)
+    if sort_by == "project_id":
+        return (value,)
+    try:
+        sort_value, project_id = json.loads(value)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+    return (sort_value, project_id)
+
+
 def get_projects(
     *,
     session: Session,
@@ -145,60 +258,103 @@ def get_projects(
     per_page: PositiveInt,
     sort_by: str,
     sort_order: Literal["asc", "desc"],
+    cursor: str | None = None,
 ) -> ProjectsPublic:
     """
     Returns all projects from the database along
     with pagination information.
+
+    With a cursor (the next_cursor of a previous page) the listing continues
+    after that project using a keyset query on the sort field, with
+    project_id breaking ties, so deep pages cost the same as the first and no
+    COUNT is run; page and the total_* fields are then unused.
     """
-    # Get total project count
-    total_count = session.exec(select(func.count()).select_from(Project)).one()
+    if cursor is not None and sort_by not in KEYSET_SORT_FIELDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination requires sort_by to be one of: "
+                   + ", ".join(KEYSET_SORT_FIELDS),
+        )
 
-    # Compute total pages
-    total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
+    # Determine sort field and direction; project_id makes the order total
+    sort_field = PROJECT_SORT_COLUMNS[sort_by]
+    sort_key = (sort_field,) if sort_by == "project_id" else (sort_field, Project.project_id)
+    order_by = [
+        field.asc() if sort_order == "asc" else field.desc() for field in sort_key
+    ]
 
-    # Determine sort field and direction
-    sort_field = getattr(Project, sort_by, Project.id)
-    sort_direction = sort_field.asc() if sort_order == "asc" else sort_field.desc()
+    if cursor is not None:
+        last_key = _decode_keyset_cursor(cursor, sort_by)
+        after_cursor = (
+            tuple_(*sort_key) > tuple_(*last_key)
+            if sort_order == "asc"
+            else tuple_(*sort_key) < tuple_(*last_key)
+        )
+        # Fetch one extra row to learn whether there is a next page
+        projects = session.exec(
+            select(Project)
+            .options(selectinload(Project.attributes))
+            .where(after_cursor)
+            .order_by(*order_by)
+            .limit(per_page + 1)
+        ).all()
+        has_next = len(projects) > per_page
+        projects = projects[:per_page]
+        total_count = total_pages = current_page = None
+        has_prev = True
+    else:
+        # Get project selection, loading every row's attributes in one query.
+        # The total project count rides along on each row as a window
+        # function, saving a separate COUNT round-trip.
+        rows = session.exec(
+            select(Project, func.count().over())
+            .options(selectinload(Project.attributes))
+            .order_by(*order_by)
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+        ).all()
+        projects = [project for project, _ in rows]
 
-    # Get project selection
-    projects = session.exec(
-        select(Project)
-        .order_by(sort_direction)
-        .limit(per_page)
-        .offset((page - 1) * per_page)
-    ).all()
+        if rows:
+            total_count = rows[0][1]
+        elif page == 1:
+            total_count = 0
+        else:
+            # Past the last page, so no row carried the count
+            total_count = session.exec(select(func.count()).select_from(Project)).one()
+
+        # Compute total pages
+        total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
+        current_page = page
+        has_next = page < total_pages
+        has_prev = page > 1
 
-    data_bucket = get_setting_value(session, "DATA_BUCKET_URI")
-    results_bucket = get_setting_value(session, "RESULTS_BUCKET_URI")
+    data_bucket, results_bucket = _bucket_uris(session)
 
     # Map to public project
     public_projects = []
     for project in projects:
         try:
+            # Sequencing runs are not included for performance reasons
             public_projects.append(
-                ProjectPublic(
-                    project_id=project.project_id,
-                    name=project.name,
-                    created_at=project.created_at,
-                    created_by=project.created_by,
-                    last_modified=project.last_modified,
-                    data_folder_uri=f"{data_bucket}/{project.project_id}/",
-                    results_folder_uri=f"{results_bucket}/{project.project_id}/",
-                    attributes=project.attributes,
-                    sequencing_runs=None  # Sequencing runs are not included for performance reasons
-                )
+                _project_public(project, project.attributes, data_bucket, results_bucket)
             )
         except ValidationError as e:
             logger.error("Skipping project %s due to invalid data: %s", project.project_id, e)
 
+    next_cursor = None
+    if has_next and projects and sort_by in KEYSET_SORT_FIELDS:
+        next_cursor = _encode_keyset_cursor(projects[-1], sort_by)
+
     return ProjectsPublic(
         data=public_projects,
         total_items=total_count,
         total_pages=total_pages,
-        current_page=page,
+        current_page=current_page,
         per_page=per_page,
-        has_next=page < total_pages,
-        has_prev=page > 1,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_cursor=next_cursor,
     )
 
 
@@ -214,21 +370,13 @@ def get_project_attributes(session: Session) -> list[str]:
     ).all()
 
 
-def get_project_by_project_id(session: Session, project_id: str) -> ProjectPublic:
-    """
-    Returns a single project by its project_id.
-    Note: This is different from its internal "id".
+def get_project_by_project_id(session: Session, project: Project) -> ProjectPublic:
     """
-    project = session.exec(
-        select(Project).where(Project.project_id == project_id)
-    ).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project {project_id} not found.",
-        )
+    Returns a single project, with its sequencing runs, as a ProjectPublic.
 
+    The project is the one already loaded (and 404-checked) by ProjectDep,
+    so it is not fetched again here.
+    """
     # Query sequencing runs associated with this project through samples
     sequencing_runs_query = (
         select(SequencingRun)
@@ -255,18 +403,13 @@ def get_project_by_project_id(session: Session, project_id: str) -> ProjectPubli
         for run in sequencing_runs
     ]
 
-    data_bucket = get_setting_value(session, "DATA_BUCKET_URI")
-    results_bucket = get_setting_value(session, "RESULTS_BUCKET_URI")
+    data_bucket, results_bucket = _bucket_uris(session)
 
-    return ProjectPublic(
-        project_id=project.project_id,
-        name=project.name,
-        created_at=project.created_at,
-        created_by=project.created_by,
-        last_modified=project.last_modified,
-        data_folder_uri=f"{data_bucket}/{project.project_id}/",
-        results_folder_uri=f"{results_bucket}/{project.project_id}/",
-        attributes=project.attributes,
+    return _project_public(
+        project,
+        project.attributes,
+        data_bucket,
+        results_bucket,
         sequencing_runs=sequencing_runs_public,
     )
 
@@ -275,87 +418,65 @@ def update_project(
     *,
     session: Session,
     opensearch_client: OpenSearch,
-    project_id: str,
+    project: Project,
     update_request: ProjectUpdate,
+    background_tasks: BackgroundTasks,
 ) -> ProjectPublic:
     """
     Update an existing project with optional name and attributes.
-    """
-    # Fetch the project
-    project = session.exec(
-        select(Project).where(Project.project_id == project_id)
-    ).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project {project_id} not found.",
-        )
 
+    The project is reindexed into OpenSearch after the response is sent.
+    """
     # Update name if provided
     if update_request.name is not None:
         project.name = update_request.name
 
     # Handle attributes if provided
+    attributes = project.attributes
     if update_request.attributes is not None:
         check_duplicate_attribute_keys(
             update_request.attributes, "project attributes"
         )
 
-        # Delete all existing attributes for this project
-        existing_attributes = session.exec(
-            select(ProjectAttribute).where(
-                ProjectAttribute.project_id == project.id
-            )
-        ).all()
-        for existing_attr in existing_attributes:
-            session.delete(existing_attr)
-
-        # Flush to execute DELETEs before INSERTs to avoid constraint violations
-        session.flush()
+        # Delete all existing attributes for this project in one statement; it
+        # executes immediately, so it lands before the INSERTs below
+        session.exec(
+            delete(ProjectAttribute).where(ProjectAttribute.project_id == project.id)
+        )
 
         # Add new attributes
-        for attr in update_request.attributes:
-            new_attr = ProjectAttribute(
-                project_id=project.id,
-                key=attr.key,
-                value=attr.value,
-            )
-            session.add(new_attr)
+        attributes = [
+            ProjectAttribute(project_id=project.id, key=attr.key, value=attr.value)
+            for attr in update_request.attributes
+        ]
+        session.add_all(attributes)
 
     # Explicitly bump last_modified (onupdate only fires when the project row itself changes)
     project.last_modified = datetime.now(tz.utc)
 
-    session.commit()
-    session.refresh(project)
+    data_bucket, results_bucket = _bucket_uris(session)
 
-    # Update project in opensearch
+    project_public = _project_public(project, attributes, data_bucket, results_bucket)
+
+    # Update project in opensearch once the commit has succeeded
     if opensearch_client:
         search_doc = SearchDocument(id=project.project_id, body=project)
-        add_object_to_index(opensearch_client, search_doc, index="projects")
+        add_object_to_index_later(
+            background_tasks, opensearch_client, search_doc, index="projects"
+        )
 
-    data_bucket = get_setting_value(session, "DATA_BUCKET_URI")
-    results_bucket = get_setting_value(session, "RESULTS_BUCKET_URI")
+    session.commit()
 
-    return ProjectPublic(
-        project_id=project.project_id,
-        name=project.name,
-        created_at=project.created_at,
-        created_by=project.created_by,
-        last_modified=project.last_modified,
-        data_folder_uri=f"{data_bucket}/{project.project_id}/",
-        results_folder_uri=f"{results_bucket}/{project.project_id}/",
-        attributes=project.attributes,
-        sequencing_runs=None  # Sequencing runs are not included in list view for performance reasons
-    )
+    return project_public
 
 
 def patch_project(
     *,
     session: Session,
     opensearch_client: OpenSearch,
-    project_id: str,
+    project: Project,
     update_request: ProjectUpdate,
+    background_tasks: BackgroundTasks,
 ) -> ProjectPublic:
     """
     Partially update a project using merge/upsert semantics.
@@ -365,23 +486,15 @@ def patch_project(
     existing keys have their value updated, new keys are inserted, and
     unmentioned keys are left untouched.  An empty attributes list is a
     no-op.
-    """
-    # Fetch the project
-    project = session.exec(
-        select(Project).where(Project.project_id == project_id)
-    ).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Project {project_id} not found.",
-        )
 
+    The project is reindexed into OpenSearch after the response is sent.
+    """
     # Update name if provided
     if update_request.name is not None:
         project.name = update_request.name
 
     # Merge/upsert attributes (does NOT remove unmentioned attributes)
+    attributes = list(project.attributes)
     if (
         update_request.attributes is not None
         and len(update_request.attributes) > 0
@@ -390,13 +503,8 @@ def patch_project(
             update_request.attributes, "project attributes"
         )
 
-        # Load all existing attributes and build case-insensitive lookup map
-        existing_attrs = session.exec(
-            select(ProjectAttribute).where(
-                ProjectAttribute.project_id == project.id
-            )
-        ).all()
-        attr_map = {a.key.lower(): a for a in existing_attrs}
+        # Build a case-insensitive lookup map of the existing attributes
+        attr_map = {a.key.lower(): a for a in project.attributes}
 
         for attr in update_request.attributes:
             existing_attr = attr_map.get(attr.key.lower())
@@ -407,45 +515,33 @@ def patch_project(
                 if existing_attr.key != attr.key:
                     existing_attr.key = attr.key
             else:
-                session.add(
-                    ProjectAttribute(
-                        project_id=project.id,
-                        key=attr.key,
-                        value=attr.value,
-                    )
+                new_attr = ProjectAttribute(
+                    project_id=project.id,
+                    key=attr.key,
+                    value=attr.value,
                 )
+                session.add(new_attr)
+                attributes.append(new_attr)
 
     # Explicitly bump last_modified (onupdate only fires when the project row itself changes)
     project.last_modified = datetime.now(tz.utc)
 
-    session.commit()
-    session.refresh(project)
+    data_bucket, results_bucket = _bucket_uris(session)
+
+    project_public = _project_public(project, attributes, data_bucket, results_bucket)
 
-    # Update project in opensearch
+    # Update project in opensearch once the commit has succeeded
     if opensearch_client:
         search_doc = SearchDocument(
             id=project.project_id, body=project
         )
-        add_object_to_index(
-            opensearch_client, search_doc, index="projects"
+        add_object_to_index_later(
+            background_tasks, opensearch_client, search_doc, index="projects"
         )
 
-    data_bucket = get_setting_value(session, "DATA_BUCKET_URI")
-    results_bucket = get_setting_value(session, "RESULTS_BUCKET_URI")
+    session.commit()
 
-    return ProjectPublic(
-        project_id=project.project_id,
-        name=project.name,
-        created_at=project.created_at,
-        created_by=project.created_by,
-        last_modified=project.last_modified,
-        data_folder_uri=f"{data_bucket}/{project.project_id}/",
-        results_folder_uri=(
-            f"{results_bucket}/{project.project_id}/"
-        ),
-        attributes=project.attributes,
-        sequencing_runs=None,
-    )
+    return project_public
 
 
 def search_projects(
@@ -456,83 +552,137 @@ def search_projects(
     per_page: int,
     sort_by: str | None = "name",
     sort_order: Literal["asc", "desc"] | None = "asc",
+    cursor: str | None = None,
 ) -> ProjectsPublic:
     """
     Search for projects
+
+    Without a cursor, pages are addressed by page number (from + size). With
+    a cursor -- the next_cursor of the previous page -- the search resumes
+    with search_after instead, so deep pages cost the cluster no more than
+    the first one.
     """
     # Construct the search query
     search_body = define_search_body(query, page, per_page, sort_by, sort_order)
+    # Only project_id is read back (the rows come from the DB), so have
+    # OpenSearch drop the rest of each hit and the response metadata
+    search_body["_source"] = ["project_id"]
+
+    # search_after needs a total order, so project_id breaks ties on the
+    # requested sort field
+    sort = search_body.get("sort", [])
+    if sort or cursor:
+        if sort_by != "project_id":
+            sort.append({"project_id.keyword": {"order": "asc"}})
+        search_body["sort"] = sort
+
+    if cursor:
+        search_after = _decode_cursor_or_400(cursor)
+        try:
+            search_body["search_after"] = json.loads(search_after)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            ) from exc
+        del search_body["from"]
+        # One extra hit tells us whether there is a next page
+        search_body["size"] = per_page + 1
 
     try:
-        response = client.search(index="projects", body=search_body)
-        total_items = response["hits"]["total"]["value"]
+        response = client.search(
+            index="projects",
+            body=search_body,
+            filter_path=[
+                "hits.total.value",
+                "hits.hits._source.project_id",
+                "hits.hits.sort",
+            ],
+        )
+    except OpenSearchConnectionError as exc:
+        # Unreachable or timed out: tell clients to back off briefly rather
+        # than hammering an overloaded cluster with retries
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Search is temporarily unavailable: {exc}",
+            headers={"Retry-After": "1"},
+        ) from exc
+    except OpenSearchException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)
+        ) from exc
+
+    total_items = response["hits"]["total"]["value"]
+    # filter_path omits hits.hits entirely when nothing matched
+    hits = response["hits"].get("hits", [])
+
+    if cursor:
+        total_pages = None
+        current_page = None
+        has_next = len(hits) > per_page
+        has_prev = True
+        hits = hits[:per_page]
+    else:
         total_pages = (total_items + per_page - 1) // per_page  # Ceiling division
+        current_page = page
+        has_next = page < total_pages
+        has_prev = page > 1
 
-        # Batch database lookup: collect all project_ids first
-        project_ids = [hit["_source"].get("project_id") for hit in response["hits"]["hits"]]
-
-        if not project_ids:
-            return ProjectsPublic(
-                data=[],
-                total_items=total_items,
-                total_pages=total_pages,
-                current_page=page,
-                per_page=per_page,
-                has_next=page < total_pages,
-                has_prev=page > 1,
-            )
-
-        # Single query to fetch all projects with their attributes
-        projects = session.exec(
-            select(Project)
-            .options(selectinload(Project.attributes))
-            .where(Project.project_id.in_(project_ids))
-        ).all()
+    next_cursor = None
+    if has_next and hits and "sort" in hits[-1]:
+        next_cursor = encode_cursor(json.dumps(hits[-1]["sort"]))
 
-        # Fetch settings once (not per-project)
-        data_bucket = get_setting_value(session, "DATA_BUCKET_URI")
-        results_bucket = get_setting_value(session, "RESULTS_BUCKET_URI")
-
-        # Create lookup map for O(1) access
-        project_map = {project.project_id: project for project in projects}
-
-        # Preserve OpenSearch ranking order
-        results = []
-        for project_id in project_ids:
-            project = project_map.get(project_id)
-            if project:
-                results.append(
-                    ProjectPublic(
-                        project_id=project.project_id,
-                        name=project.name,
-                        created_at=project.created_at,
-                        created_by=project.created_by,
-                        last_modified=project.last_modified,
-                        data_folder_uri=f"{data_bucket}/{project.project_id}/",
-                        results_folder_uri=f"{results_bucket}/{project.project_id}/",
-                        attributes=project.attributes,
-                        sequencing_runs=None,  # Not included for performance (matches get_projects)
-                    )
-                )
+    # Batch database lookup: collect all project_ids first
+    project_ids = [hit["_source"].get("project_id") for hit in hits]
 
+    if not project_ids:
         return ProjectsPublic(
-            data=results,
+            data=[],
             total_items=total_items,
             total_pages=total_pages,
-            current_page=page,
+            current_page=current_page,
             per_page=per_page,
-            has_next=page < total_pages,
-            has_prev=page > 1,
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=next_cursor,
         )
 
-    except Exception as e:
-        if project:
-            details = f"{project.project_id}: {str(e)}"
-        else:
-            details = str(e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=details
-        )
+    # Single query to fetch all projects with their attributes
+    projects = session.exec(
+        select(Project)
+        .options(selectinload(Project.attributes))
+        .where(Project.project_id.in_(project_ids))
+    ).all()
+
+    # Fetch settings once (not per-project)
+    data_bucket, results_bucket = _bucket_uris(session)
+
+    # Create lookup map for O(1) access
+    project_map = {project.project_id: project for project in projects}
+
+    # Preserve OpenSearch ranking order
+    results = []
+    for project_id in project_ids:
+        project = project_map.get(project_id)
+        if not project:
+            continue
+        try:
+            # Sequencing runs are not included for performance (matches get_projects)
+            results.append(
+                _project_public(project, project.attributes, data_bucket, results_bucket)
+            )
+        except ValidationError as e:
+            logger.error("Skipping project %s due to invalid data: %s", project.project_id, e)
+
+    return ProjectsPublic(
+        data=results,
+        total_items=total_items,
+        total_pages=total_pages,
+        current_page=current_page,
+        per_page=per_page,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_cursor=next_cursor,
+    )
 
 
 def reindex_projects(
@@ -542,19 +692,21 @@ def reindex_projects(
     """
     Index all projects in database with OpenSearch
     """
+    # Stream rows in batches rather than materializing the whole table; the
+    # indexed fields are plain columns, so no lazy loads fire mid-stream
     projects = session.exec(
-        select(Project).order_by(Project.project_id)
-    ).all()
-
-    # Prepare all documents
-    search_docs = []
-    for project in projects:
-        search_doc = SearchDocument(id=project.project_id, body=project)
-        search_docs.append(search_doc)
+        select(Project)
+        .order_by(Project.project_id)
+        .execution_options(yield_per=REINDEX_YIELD_PER)
+    )
+    search_docs = (
+        SearchDocument(id=project.project_id, body=project) for project in projects
+    )
 
     reset_index(client, "projects")
     # Bulk index all documents in one call
-    add_objects_to_index(client, search_docs, "projects")
+    with bulk_load_index(client, "projects"):
+        add_objects_to_index(client, search_docs, "projects", refresh=False)
 
 
 def submit_pipeline_job(
@@ -647,16 +799,7 @@ def submit_pipeline_job(
             )
 
         # Find the matching export entry
-        reference_value = None
-        for export_item in platform_config.exports:
-            # Each export_item is a dict with one key-value pair
-            for label, value in export_item.items():
-                if label == reference:
-                    reference_value = value
-                    break
-            if reference_value:
-                break
-
+        reference_value = platform_config.export_reference(reference)
         if reference_value is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -750,6 +893,7 @@ def add_sample_to_project(
     opensearch_client: OpenSearch,
     project: Project,
     sample_in: SampleCreate,
+    background_tasks: BackgroundTasks,
     created_by: str | None = None,
 ) -> Sample:
     """
@@ -763,6 +907,7 @@ def add_sample_to_project(
         opensearch_client: OpenSearch client for indexing
         project: The project object (already validated)
         sample_in: Sample creation data (may include run_id)
+        background_tasks: Runs the OpenSearch indexing after the response
         created_by: Username recorded on any SampleSequencingRun row
 
     Returns:
@@ -770,6 +915,9 @@ def add_sample_to_project(
     """
     from api.runs.services import get_run
 
+    # Reject duplicate attribute keys before touching the database
+    check_duplicate_attribute_keys(sample_in.attributes or [], "sample attributes")
+
     # Resolve run up-front so we can fail fast before creating the sample
     run = None
     if sample_in.run_id:
@@ -794,10 +942,6 @@ def add_sample_to_project(
 
     # Handle attribute mapping
     if sample_in.attributes:
-        check_duplicate_attribute_keys(
-            sample_in.attributes, "sample attributes"
-        )
-
         # Create sample attributes
         sample_attributes = [
             SampleAttribute(sample_id=sample.id, key=attr.key, value=attr.value)
@@ -829,13 +973,13 @@ def add_sample_to_project(
     session.commit()
     session.refresh(sample)
 
-    # Add sample to opensearch (best-effort; DB is source of truth)
+    # Add sample to opensearch after the response (best-effort; DB is
+    # source of truth)
     if opensearch_client:
         search_doc = SearchDocument(id=str(sample.id), body=sample)
-        try:
-            add_object_to_index(opensearch_client, search_doc, index="samples")
-        except Exception:
-            pass  # best-effort indexing; can be resynced via /reindex
+        add_object_to_index_later(
+            background_tasks, opensearch_client, search_doc, index="samples"
+        )
 
     return sample
 
@@ -886,6 +1030,7 @@ def get_project_samples(
     sort_order: Literal["asc", "desc"],
     include: list[str] | None = None,
     file_versions: str = "latest",
+    cursor: str | None = None,
 ) -> SamplesPublic | SamplesWithFilesPublic:
     """
     Get a paginated list of samples for a specific project.
@@ -900,6 +1045,9 @@ def get_project_samples(
         include: Optional list of related data to include (e.g. ``["files"]``)
         file_versions: ``"latest"`` (default) returns only the newest file per
             URI; ``"all"`` returns every version.
+        cursor: Optional next_cursor of a previous page. Continues after that
+            sample with a keyset query on sample_id instead of skip, and
+            skips the total count.
 
     Returns:
         SamplesPublic or SamplesWithFilesPublic depending on *include*
@@ -910,13 +1058,22 @@ def get_project_samples(
 
     include_files = include is not None and "files" in include
 
-    # Get the total count of samples for the project
-    total_count = session.exec(
-        select(func.count()).select_from(Sample).where(Sample.project_id == project.project_id)
-    ).one()
+    if cursor is not None and sort_by != "sample_id":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination requires sort_by=sample_id",
+        )
 
-    # Build the select statement
-    statement = select(Sample).where(Sample.project_id == project.project_id)
+    # Build the select statement; attributes feed data_cols and every row,
+    # so load them for the whole page in one query. Offset pages also carry
+    # the project's sample count on each row as a window function, saving a
+    # separate COUNT round-trip.
+    entities = (Sample,) if cursor is not None else (Sample, func.count().over())
+    statement = (
+        select(*entities)
+        .options(selectinload(Sample.attributes))
+        .where(Sample.project_id == project.project_id)
+    )
 
     # Eagerly load file associations when requested
     if include_files:
@@ -926,28 +1083,54 @@ def get_project_samples(
             .selectinload(File.tags)  # type: ignore[attr-defined]
         )
 
-    # Add sorting
-    if hasattr(Sample, sort_by):
-        sort_column = getattr(Sample, sort_by)
-        if sort_order == "desc":
-            sort_column = sort_column.desc()
-        statement = statement.order_by(sort_column)
+    # Add sorting; sample_id is unique within the project, so it makes the
+    # order total (and pages stable) when sorting by a timestamp
+    sort_key = [SAMPLE_SORT_COLUMNS[sort_by]]
+    if sort_by != "sample_id":
+        sort_key.append(Sample.sample_id)
+    statement = statement.order_by(
+        *(column.desc() if sort_order == "desc" else column for column in sort_key)
+    )
+
+    if cursor is not None:
+        last_sample_id = _decode_cursor_or_400(cursor)
+        statement = statement.where(
+            Sample.sample_id > last_sample_id
+            if sort_order == "asc"
+            else Sample.sample_id < last_sample_id
+        )
+        # Fetch one extra row to learn whether there is a next page
+        samples = session.exec(statement.limit(limit + 1)).all()
+        has_next = len(samples) > limit
+        samples = samples[:limit]
+        total_count = skip = None
+        has_prev = True
+    else:
+        # Add pagination and execute the query
+        rows = session.exec(statement.offset(skip).limit(limit)).all()
+        samples = [sample for sample, _ in rows]
+
+        if rows:
+            total_count = rows[0][1]
+        elif skip == 0:
+            total_count = 0
+        else:
+            # Past the last sample, so no row carried the count
+            total_count = session.exec(
+                select(func.count())
+                .select_from(Sample)
+                .where(Sample.project_id == project.project_id)
+            ).one()
 
-    # Add pagination
-    statement = statement.offset(skip).limit(limit)
+        has_next = (skip + limit) < total_count
+        has_prev = skip > 0
 
-    # Execute the query
-    samples = session.exec(statement).all()
+    next_cursor = None
+    if has_next and samples and sort_by == "sample_id":
+        next_cursor = encode_cursor(samples[-1].sample_id)
 
     # Collect all unique attribute keys across all samples for data_cols
-    data_cols = None
-    if samples:
-        all_keys = set()
-        for sample in samples:
-            if sample.attributes:
-                for attr in sample.attributes:
-                    all_keys.add(attr.key)
-        data_cols = sorted(list(all_keys)) if all_keys else None
+    data_cols = sample_data_cols(samples)
 
     # Build response with or without files
     if include_files:
@@ -981,8 +1164,9 @@ def get_project_samples(
             total_items=total_count,
             skip=skip,
             limit=limit,
-            has_next=(skip + limit) < total_count,
-            has_prev=skip > 0,
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=next_cursor,
         )
 
     # Default: no files
@@ -1001,8 +1185,9 @@ def get_project_samples(
         total_items=total_count,
         skip=skip,
         limit=limit,
-        has_next=(skip + limit) < total_count,
-        has_prev=skip > 0,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_cursor=next_cursor,
     )
 
 
@@ -1024,9 +1209,11 @@ def update_sample_in_project(
     Returns:
         Updated sample
     """
-    # Fetch the sample
+    # Fetch the sample, loading its attributes with it
     sample = session.exec(
-        select(Sample).where(
+        select(Sample)
+        .options(selectinload(Sample.attributes))
+        .where(
             Sample.sample_id == sample_id,
             Sample.project_id == project.project_id
         )
@@ -1038,13 +1225,11 @@ def update_sample_in_project(
             detail=f"Sample {sample_id} in project {project.project_id} not found.",
         )
 
-    # Load all attributes for this sample and build a case-insensitive
-    # lookup map (avoids func.lower() in SQL which suppresses index use
-    # and mirrors the approach in bulk_create_samples).
-    existing_attrs = session.exec(
-        select(SampleAttribute).where(SampleAttribute.sample_id == sample.id)
-    ).all()
-    attr_map = {a.key.lower(): a for a in existing_attrs}
+    # Build a case-insensitive lookup map of the attributes (avoids
+    # func.lower() in SQL which suppresses index use and mirrors the
+    # approach in bulk_create_samples).
+    attributes = list(sample.attributes or [])
+    attr_map = {a.key.lower(): a for a in attributes}
     sample_attribute = attr_map.get(attribute.key.lower())
 
     if sample_attribute:
@@ -1061,18 +1246,18 @@ def update_sample_in_project(
             value=attribute.value
         )
         session.add(new_attribute)
+        attributes.append(new_attribute)
 
     sample.updated_at = datetime.now(tz.utc)
-    session.commit()
-    session.refresh(sample)
 
-    return SamplePublic(
+    sample_public = SamplePublic(
         sample_id=sample.sample_id,
         project_id=sample.project_id,
-        attributes=[
-            Attribute(key=attr.key, value=attr.value) for attr in (sample.attributes or [])
-        ] if sample.attributes else []
+        attributes=[Attribute(key=attr.key, value=attr.value) for attr in attributes]
     )
+    session.commit()
+
+    return sample_public
 
 
 def _read_vendor_config_yaml(session: Session, s3_client=None) -> VendorIngestionConfig:
@@ -1100,7 +1285,7 @@ def _read_vendor_config_yaml(session: Session, s3_client=None) -> VendorIngestio
     # Read the vendor ingestion configuration from S3
     try:
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
         response = s3_client.get_object(Bucket=bucket, Key=prefix)
         config_content = response["Body"].read().decode("utf-8")
         config = yaml.safe_load(config_content)
@@ -3,7 +3,6 @@ Services for managing sequencing runs.
 """
 import json
 import yaml
-import boto3
 
 from typing import Literal
 from sqlmodel import select, Session, func
@@ -17,6 +16,9 @@ from core.utils import interpolate
 
 from sample_sheet import SampleSheet as IlluminaSampleSheet
 
+from core.cache import TTLCache
+from core.config import get_settings
+from core.deps import get_aws_client
 from core.utils import define_search_body
 from core.logger import logger
 
@@ -38,8 +40,10 @@ from api.samples.models import Sample, SampleAttribute
 from api.files.models import File, FileSequencingRun, FileSample
 from api.qcmetrics.models import QCMetricSample
 from api.search.services import (
+    REINDEX_YIELD_PER,
     add_object_to_index,
     add_objects_to_index,
+    bulk_load_index,
     delete_document_from_index,
     reset_index
 )
@@ -50,6 +54,11 @@ from api.jobs.services import submit_batch_job
 from api.jobs.models import BatchJobPublic
 from api.settings.services import get_setting_value
 
+# Demux workflow listings and parsed configs keyed by (bucket, prefix[, workflow_id]),
+# held for WORKFLOW_CONFIG_CACHE_TTL seconds
+_demux_workflow_config_cache = TTLCache(maxsize=256)
+_CACHE_MISS = object()
+
 
 def add_run(
     session: Session,
@@ -259,22 +268,18 @@ def reindex_runs(
     """
     Index all runs in database with OpenSearch
     """
+    # Stream runs ordered by run_id for a consistent indexing order
     runs = session.exec(
         select(SequencingRun)
-    ).all()
-
-    # Sort the runs by run_id to ensure consistent indexing order
-    runs.sort(key=lambda r: r.run_id)
-
-    # Prepare all documents
-    search_docs = []
-    for run in runs:
-        search_doc = SearchDocument(id=run.run_id, body=run)
-        search_docs.append(search_doc)
+        .order_by(SequencingRun.run_id)
+        .execution_options(yield_per=REINDEX_YIELD_PER)
+    )
+    search_docs = (SearchDocument(id=run.run_id, body=run) for run in runs)
 
     reset_index(client, "illumina_runs")
     # Bulk index all documents in one call
-    add_objects_to_index(client, search_docs, "illumina_runs")
+    with bulk_load_index(client, "illumina_runs"):
+        add_objects_to_index(client, search_docs, "illumina_runs", refresh=False)
 
 
 def get_run_samplesheet(session: Session, run_id: str):
@@ -534,9 +539,14 @@ def list_demux_workflow_configs(session: Session, s3_client=None) -> list[str]:
     """
     bucket, prefix = _get_demux_workflow_configs_s3_location(session)
 
+    cache_key = (bucket, prefix)
+    cached = _demux_workflow_config_cache.get(cache_key, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        return list(cached)
+
     try:
         if s3_client is None:
-            s3_client = boto3.client("s3")
+            s3_client = get_aws_client("s3")
 
         # List objects in the bucket/prefix
         paginator = s3_client.get_paginator("list_objects_v2")
@@ -561,7 +571,11 @@ def list_demux_workflow_configs(session: Session, s3_client=None) -> list[str]:
                     workflow_id = filename.rsplit(".", 1)[0]
                     workflow_configs.append(workflow_id)
 
-        return sorted(workflow_configs)
+        workflow_configs.sort()
+        _demux_workflow_config_cache.set(
+            cache_key, tuple(workflow_configs), get_settings().WORKFLOW_CONFIG_CACHE_TTL
+        )
+        return workflow_configs
 
     except NoCredentialsError as exc:
         raise HTTPException(
@@ -594,6 +608,46 @@ def list_demux_workflow_configs(session: Session, s3_client=None) -> list[str]:
         ) from exc
 
 
+def _fetch_demux_workflow_config(
+    s3_client, bucket: str, prefix: str, workflow_id: str
+) -> DemuxWorkflowConfig:
+    """
+    Read and parse a demultiplex workflow config from S3, trying both the
+    .yaml and .yml extensions. S3 and YAML errors propagate to the caller.
+    """
+    if s3_client is None:
+        s3_client = get_aws_client("s3")
+
+    # Try both .yaml and .yml extensions
+    key = None
+    for ext in [".yaml", ".yml"]:
+        potential_key = f"{prefix}{workflow_id}{ext}"
+        try:
+            # Try to get the object directly instead of using head_object
+            response = s3_client.get_object(Bucket=bucket, Key=potential_key)
+            key = potential_key
+            yaml_content = response["Body"].read().decode("utf-8")
+            break
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code in ["NoSuchKey", "404"]:
+                continue  # Try next extension
+            else:
+                raise  # Re-raise other errors
+
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Demultiplex workflow config '{workflow_id}' not found",
+        )
+
+    # Parse YAML
+    config_data = yaml.safe_load(yaml_content)
+
+    # Validate and return as DemuxWorkflowConfig model
+    return DemuxWorkflowConfig(**config_data)
+
+
 def get_demux_workflow_config(
     session: Session, workflow_id: str, s3_client=None, run_id: str = None
 ) -> DemuxWorkflowConfig:
@@ -612,38 +666,19 @@ def get_demux_workflow_config(
     bucket, prefix = _get_demux_workflow_configs_s3_location(session)
 
     try:
-        if s3_client is None:
-            s3_client = boto3.client("s3")
-
-        # Try both .yaml and .yml extensions
-        key = None
-        for ext in [".yaml", ".yml"]:
-            potential_key = f"{prefix}{workflow_id}{ext}"
-            try:
-                # Try to get the object directly instead of using head_object
-                response = s3_client.get_object(Bucket=bucket, Key=potential_key)
-                key = potential_key
-                yaml_content = response["Body"].read().decode("utf-8")
-                break
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                if error_code in ["NoSuchKey", "404"]:
-                    continue  # Try next extension
-                else:
-                    raise  # Re-raise other errors
-
-        if key is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Demultiplex workflow config '{workflow_id}' not found",
+        cache_key = (bucket, prefix, workflow_id)
+        cached = _demux_workflow_config_cache.get(cache_key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            # Copy so the run-specific defaults below never leak into the cache
+            config = cached.model_copy(deep=True)
+        else:
+            config = _fetch_demux_workflow_config(s3_client, bucket, prefix, workflow_id)
+            _demux_workflow_config_cache.set(
+                cache_key,
+                config.model_copy(deep=True),
+                get_settings().WORKFLOW_CONFIG_CACHE_TTL,
             )
 
-        # Parse YAML
-        config_data = yaml.safe_load(yaml_content)
-
-        # Validate and return as DemuxWorkflowConfig model
-        config = DemuxWorkflowConfig(**config_data)
-
         # If run_id is provided, prepopulate s3_run_folder_path from the run's run_folder_uri
         if run_id:
             run = get_run(session=session, run_id=run_id)
@@ -5,7 +5,7 @@ Models for the Sample API
 import uuid
 from datetime import datetime
 from typing import List, TYPE_CHECKING
-from sqlmodel import SQLModel, Field, Relationship, UniqueConstraint
+from sqlmodel import SQLModel, Field, Index, Relationship, UniqueConstraint
 from pydantic import ConfigDict, field_validator
 
 if TYPE_CHECKING:
@@ -42,7 +42,12 @@ class Sample(SQLModel, table=True):
 
     model_config = ConfigDict(from_attributes=True)
 
-    __table_args__ = (UniqueConstraint("sample_id", "project_id"),)
+    __table_args__ = (
+        UniqueConstraint("sample_id", "project_id"),
+        # A project's samples in sample_id order: serves the listing's keyset
+        # cursor as a range scan
+        Index("ix_sample_project_id_sample_id", "project_id", "sample_id"),
+    )
 
 
 class SampleFileInput(SQLModel):
@@ -74,14 +79,17 @@ class SamplePublic(SQLModel):
 
 
 class SamplesPublic(SQLModel):
-    """Paginated list of samples using offset-based pagination (skip/limit)."""
+    """Paginated list of samples (offset-based skip/limit, or keyset via cursor)."""
     data: List[SamplePublic]
     data_cols: list[str] | None = None
-    total_items: int
-    skip: int
+    # Not computed for cursor (keyset) pages
+    total_items: int | None
+    skip: int | None
     limit: int
     has_next: bool
     has_prev: bool
+    # Set when there is a next page of a sample_id-sorted listing
+    next_cursor: str | None = None
 
 
 class SamplesPublicSearchResponse(SQLModel):
@@ -117,11 +125,14 @@ class SamplesWithFilesPublic(SQLModel):
     """Paginated list of samples with file data included."""
     data: List[SampleWithFilesPublic]
     data_cols: list[str] | None = None
-    total_items: int
-    skip: int
+    # Not computed for cursor (keyset) pages
+    total_items: int | None
+    skip: int | None
     limit: int
     has_next: bool
     has_prev: bool
+    # Set when there is a next page of a sample_id-sorted listing
+    next_cursor: str | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -2,14 +2,15 @@
 Parse CSV/TSV files into SampleCreate objects for bulk sample upload.
 
 This module is a pure parsing layer — no database or FastAPI dependencies.
-It accepts raw file bytes + filename and returns a list of SampleCreate objects
-ready for the bulk_create_samples() service.
+It accepts raw file bytes (or a binary file object) + filename and returns a
+list of SampleCreate objects ready for the bulk_create_samples() service.
 """
 
 import csv
 import io
+import itertools
 import re
-from typing import List
+from typing import BinaryIO, List
 
 from api.samples.models import SampleCreate, Attribute
 
@@ -22,6 +23,9 @@ _SAMPLE_ID_CANONICAL = "sampleid"
 
 ALLOWED_EXTENSIONS = {"csv", "tsv", "txt"}
 
+# Bytes of text handed to csv.Sniffer for delimiter detection
+_SNIFF_SIZE = 8192
+
 
 def _normalize_header(header: str) -> str:
     """
@@ -43,7 +47,7 @@ def _normalize_header(header: str) -> str:
 
 
 def parse_sample_file(
-    file_content: bytes,
+    file_content: bytes | BinaryIO,
     filename: str,
 ) -> List[SampleCreate]:
     """
@@ -59,8 +63,12 @@ def parse_sample_file(
     - Includes empty cell values as value="" for downstream deletion
     - Preserves original column header as attribute key
 
+    A file object is decoded and parsed line by line rather than read into
+    memory whole; it must be seekable so a non-UTF-8 file can be re-read as
+    Latin-1.
+
     Args:
-        file_content: Raw bytes of the uploaded file
+        file_content: Raw bytes of the uploaded file, or a binary file object
         filename: Original filename (used for extension validation)
 
     Returns:
@@ -78,30 +86,55 @@ def parse_sample_file(
             f"Allowed extensions: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
         )
 
+    stream = io.BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+
     # ── Decode content ────────────────────────────────────────────────
     try:
-        text = file_content.decode("utf-8-sig")  # handles BOM
+        return _parse_stream(stream, encoding="utf-8-sig")  # handles BOM
     except UnicodeDecodeError:
-        try:
-            text = file_content.decode("latin-1")
-        except UnicodeDecodeError:
-            raise ValueError("Unable to decode file — expected UTF-8 or Latin-1 encoding")
+        stream.seek(0)
+        return _parse_stream(stream, encoding="latin-1")
 
-    text = text.strip()
-    if not text:
-        raise ValueError("File is empty")
 
-    # ── Detect delimiter ──────────────────────────────────────────────
+def _read_head(text: io.TextIOBase) -> str:
+    """
+    The start of text, at least _SNIFF_SIZE characters and whole lines, with
+    leading blank space dropped; ValueError if there is nothing else.
+    """
+    head = ""
+    while not head.strip():
+        chunk = text.read(_SNIFF_SIZE)
+        if not chunk:
+            raise ValueError("File is empty")
+        head += chunk
+    # Finish the line the last chunk ended in, so the rest of text picks up
+    # at a line boundary
+    return head.lstrip() + text.readline()
+
+
+def _parse_stream(stream: BinaryIO, encoding: str) -> List[SampleCreate]:
+    """Decode stream lazily and parse its rows (see parse_sample_file)"""
+    text = io.TextIOWrapper(stream, encoding=encoding, newline="")
     try:
-        sample = text[:8192]  # sniff first 8KB
-        dialect = csv.Sniffer().sniff(sample, delimiters=",\t")
-    except csv.Error:
-        # Default to comma if sniffer fails
-        dialect = csv.excel
+        head = _read_head(text)
+
+        # ── Detect delimiter ──────────────────────────────────────────
+        try:
+            sample = head[:_SNIFF_SIZE]  # sniff first 8KB
+            dialect = csv.Sniffer().sniff(sample, delimiters=",\t")
+        except csv.Error:
+            # Default to comma if sniffer fails
+            dialect = csv.excel
+
+        lines = itertools.chain(io.StringIO(head, newline=""), text)
+        return _parse_rows(csv.DictReader(lines, dialect=dialect))
+    finally:
+        # Leave the caller's file open
+        text.detach()
 
-    # ── Parse ─────────────────────────────────────────────────────────
-    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
 
+def _parse_rows(reader: csv.DictReader) -> List[SampleCreate]:
+    """Build SampleCreate objects from the parsed rows (see parse_sample_file)"""
     if not reader.fieldnames:
         raise ValueError("File has no column headers")
 
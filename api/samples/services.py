@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import List, Literal
 
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from api.utils import check_duplicate_attribute_keys
 from sqlmodel import Session, select, func
 from sqlalchemy.orm import selectinload
@@ -29,9 +29,28 @@ from api.search.models import SearchDocument
 from api.search.services import (
     add_object_to_index,
     add_objects_to_index,
+    add_objects_to_index_later,
+    bulk_load_index,
     reset_index,
 )
 
+# Columns sample listings may be sorted by
+SAMPLE_SORT_COLUMNS = {
+    "sample_id": Sample.sample_id,
+    "created_at": Sample.created_at,
+    "updated_at": Sample.updated_at,
+}
+
+
+def sample_data_cols(samples: List[Sample]) -> List[str] | None:
+    """
+    The distinct attribute keys across a page of samples, sorted, or None
+    when none of them have attributes. The attributes are already loaded to
+    build the response, so this reads them rather than querying again.
+    """
+    keys = {attr.key for sample in samples for attr in sample.attributes or ()}
+    return sorted(keys) if keys else None
+
 
 def resolve_or_create_sample(
     session: Session,
@@ -95,6 +114,9 @@ def add_sample_to_project(
     """
     Create a new sample with optional attributes.
     """
+    # Reject duplicate attribute keys before touching the database
+    check_duplicate_attribute_keys(sample_in.attributes or [], "sample attributes")
+
     # Check if project exists
     project = session.exec(
         select(Project).where(Project.project_id == project_id)
@@ -116,10 +138,6 @@ def add_sample_to_project(
 
     # Handle attribute mapping
     if sample_in.attributes:
-        check_duplicate_attribute_keys(
-            sample_in.attributes, "sample attributes"
-        )
-
         # Parse and create project attributes (skip empty/whitespace-only values)
         sample_attributes = [
             SampleAttribute(sample_id=sample.id, key=attr.key, value=attr.value)
@@ -172,15 +190,18 @@ def get_samples(
         select(func.count()).select_from(Sample).where(Sample.project_id == project_id)
     ).one()
 
-    # Build the select statement
-    statement = select(Sample).where(Sample.project_id == project_id)
+    # Build the select statement, loading the page's attributes in one query
+    statement = (
+        select(Sample)
+        .options(selectinload(Sample.attributes))
+        .where(Sample.project_id == project_id)
+    )
 
     # Add sorting
-    if hasattr(Sample, sort_by):
-        sort_column = getattr(Sample, sort_by)
-        if sort_order == "desc":
-            sort_column = sort_column.desc()
-        statement = statement.order_by(sort_column)
+    sort_column = SAMPLE_SORT_COLUMNS[sort_by]
+    if sort_order == "desc":
+        sort_column = sort_column.desc()
+    statement = statement.order_by(sort_column)
 
     # Add pagination
     statement = statement.offset(skip).limit(limit)
@@ -200,14 +221,7 @@ def get_samples(
     ]
 
     # Collect all unique attribute keys across all samples for data_cols
-    data_cols = None
-    if samples:
-        all_keys = set()
-        for sample in samples:
-            if sample.attributes:
-                for attr in sample.attributes:
-                    all_keys.add(attr.key)
-        data_cols = sorted(all_keys) if all_keys else None
+    data_cols = sample_data_cols(samples)
 
     return SamplesPublic(
         data=public_samples,
@@ -236,30 +250,27 @@ def reindex_samples(
     logger.info("Reindexing %d samples in %d batch(es) of %d", total, total_batches, batch_size)
     reset_index(client, "samples")
 
-    indexed = 0
-    batch_num = 0
-    while True:
-        samples = session.exec(
-            select(Sample).offset(indexed).limit(batch_size)
-        ).all()
-
-        if not samples:
-            break
-
-        batch_num += 1
-        search_docs = [
-            SearchDocument(id=str(s.id), body=s) for s in samples
-        ]
-        add_objects_to_index(client, search_docs, "samples")
-
-        indexed += len(samples)
-        logger.info(
-            "Indexing batch %d/%d — %d samples indexed out of %d total",
-            batch_num, total_batches, indexed, total,
-        )
+    # Stream the table in batch_size partitions off a single ordered query;
+    # OFFSET paging rescanned every earlier row on each batch
+    samples = session.exec(
+        select(Sample)
+        .order_by(Sample.id)
+        .execution_options(yield_per=batch_size)
+    )
 
-        if len(samples) < batch_size:
-            break
+    indexed = 0
+    with bulk_load_index(client, "samples"):
+        for batch_num, batch in enumerate(samples.partitions(), start=1):
+            search_docs = [
+                SearchDocument(id=str(s.id), body=s) for s in batch
+            ]
+            add_objects_to_index(client, search_docs, "samples", refresh=False)
+
+            indexed += len(batch)
+            logger.info(
+                "Indexing batch %d/%d — %d samples indexed out of %d total",
+                batch_num, total_batches, indexed, total,
+            )
 
     logger.info("Reindex complete: %d samples indexed", indexed)
 
@@ -496,14 +507,7 @@ def search_samples(
     ]
 
     # Collect all unique attribute keys across matched samples for data_cols
-    data_cols = None
-    if samples:
-        all_keys = set()
-        for sample in samples:
-            if sample.attributes:
-                for attr in sample.attributes:
-                    all_keys.add(attr.key)
-        data_cols = sorted(all_keys) if all_keys else None
+    data_cols = sample_data_cols(samples)
 
     return SamplesPublicSearchResponse(
         data=public_samples,
@@ -730,6 +734,7 @@ def bulk_create_samples(
     project: Project,
     samples_in: List[SampleCreate],
     created_by: str,
+    background_tasks: BackgroundTasks,
 ) -> BulkSampleCreateResponse:
     """
     Create multiple samples in a single atomic transaction.
@@ -746,6 +751,7 @@ def bulk_create_samples(
         project: The project object (already validated by route dependency)
         samples_in: List of SampleCreate items
         created_by: Username recorded on any SampleSequencingRun rows
+        background_tasks: Runs the OpenSearch indexing after the response
 
     Returns:
         BulkSampleCreateResponse with per-item details and aggregate counts
@@ -967,20 +973,22 @@ def bulk_create_samples(
         total_files_created += item_files_created
         total_files_skipped += item_files_skipped
 
+    # ── Index newly created and updated samples in OpenSearch once the ───────────
+    # commit has succeeded and the response is sent (best-effort)
+    if opensearch_client and (newly_created_samples or updated_samples):
+        add_objects_to_index_later(
+            background_tasks,
+            opensearch_client,
+            (
+                SearchDocument(id=str(sample.id), body=sample)
+                for sample in newly_created_samples + updated_samples
+            ),
+            index="samples",
+        )
+
     # Single commit — all or nothing
     session.commit()
 
-    # ── Post-commit: index newly created and updated samples in OpenSearch ────────
-    if opensearch_client and (newly_created_samples or updated_samples):
-        search_docs = []
-        for sample in newly_created_samples + updated_samples:
-            session.refresh(sample)
-            search_docs.append(SearchDocument(id=str(sample.id), body=sample))
-        try:
-            add_objects_to_index(opensearch_client, search_docs, index="samples")
-        except Exception:
-            pass  # best-effort indexing
-
     return BulkSampleCreateResponse(
         project_id=project.project_id,
         samples_created=samples_created,
@@ -1,6 +1,10 @@
 """
 Search-related services
 """
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from fastapi import BackgroundTasks
 from opensearchpy import OpenSearch, helpers
 from sqlmodel import Session
 
@@ -11,52 +15,81 @@ from api.search.models import (
     SearchResponse,
 )
 
+# helpers.bulk sends a request per chunk, whichever limit is hit first
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 100 * 1024 * 1024
+
+# Rows fetched per round-trip when streaming a table into a reindex
+REINDEX_YIELD_PER = 1000
+
+
+def _searchable_payload(body) -> dict:
+    """
+    Collect the non-empty __searchable__ fields of body for indexing. A dict
+    body is a payload collected earlier and is used as is.
+    """
+    if isinstance(body, dict):
+        return body
+    payload = {}
+    for field in body.__searchable__:
+        value = getattr(body, field)
+        if value:
+            payload[field] = value
+    return payload
+
 
 def add_objects_to_index(
-    client: OpenSearch, documents: list[SearchDocument], index: str
+    client: OpenSearch,
+    documents: Iterable[SearchDocument],
+    index: str,
+    refresh: bool = True,
 ) -> None:
     """
     Add multiple documents to the OpenSearch index in one bulk operation.
 
     Args:
         client: OpenSearch client
-        documents: List of SearchDocument objects to index
+        documents: SearchDocument objects to index; may be a generator, in
+            which case it is consumed lazily chunk by chunk
         index: The index name
+        refresh: Refresh the index afterwards; pass False when the caller
+            refreshes once itself (see bulk_load_index)
     """
     if client is None:
         logger.warning("OpenSearch client is not available.")
         return
 
-    if not documents:
+    if isinstance(documents, list) and not documents:
         logger.info("No documents to index.")
         return
 
-    # Prepare bulk actions
-    actions = []
-    for document in documents:
-        payload = {}
-        for field in document.body.__searchable__:
-            value = getattr(document.body, field)
-            if value:
-                payload[field] = value
-
-        action = {
+    # Prepare bulk actions lazily so streamed documents are never all in memory
+    actions = (
+        {
             "_index": index,
             "_id": str(document.id),
-            "_source": payload
+            "_source": _searchable_payload(document.body)
         }
-        actions.append(action)
+        for document in documents
+    )
 
     # Perform bulk indexing
     try:
         success, failed = helpers.bulk(
-            client, actions, raise_on_error=False, stats_only=False)
+            client,
+            actions,
+            chunk_size=BULK_CHUNK_SIZE,
+            max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+            raise_on_error=False,
+            stats_only=False,
+        )
         logger.info(f"Bulk indexed {success} documents successfully")
         if failed:
             logger.warning(f"Failed to index {len(failed)} documents")
 
         # Refresh the index once after bulk operation
-        client.indices.refresh(index=index)
+        if refresh:
+            client.indices.refresh(index=index)
     except Exception as e:
         logger.error(f"Bulk indexing failed: {e}")
         raise
@@ -73,17 +106,77 @@ def add_object_to_index(
         logger.warning("OpenSearch client is not available.")
         return
 
-    payload = {}
-    for field in document.body.__searchable__:
-        value = getattr(document.body, field)
-        if value:
-            payload[field] = getattr(document.body, field)
-
     # Index the document
-    client.index(index=index, id=str(document.id), body=payload)
+    client.index(index=index, id=str(document.id), body=_searchable_payload(document.body))
     client.indices.refresh(index=index)
 
 
+def add_object_to_index_later(
+    background_tasks: BackgroundTasks,
+    client: OpenSearch,
+    document: SearchDocument,
+    index: str,
+) -> None:
+    """
+    Index a document once the response has been sent.
+
+    The searchable fields are read now, while document.body is still bound to
+    its session. The task only runs if the route returns successfully, so
+    scheduling it before the commit is safe.
+    """
+    if client is None:
+        logger.warning("OpenSearch client is not available.")
+        return
+
+    background_tasks.add_task(
+        _index_payload, client, str(document.id), _searchable_payload(document.body), index
+    )
+
+
+def _index_payload(client: OpenSearch, document_id: str, payload: dict, index: str) -> None:
+    """Background task body for add_object_to_index_later"""
+    try:
+        client.index(index=index, id=document_id, body=payload)
+        client.indices.refresh(index=index)
+    except Exception:
+        # The row is committed and the client has its response; /reindex
+        # can resync the index
+        logger.exception("Failed to index %s into %s", document_id, index)
+
+
+def add_objects_to_index_later(
+    background_tasks: BackgroundTasks,
+    client: OpenSearch,
+    documents: Iterable[SearchDocument],
+    index: str,
+) -> None:
+    """
+    Bulk-index documents once the response has been sent.
+
+    Like add_object_to_index_later, the searchable fields are read now and
+    the task only runs if the route returns successfully.
+    """
+    if client is None:
+        logger.warning("OpenSearch client is not available.")
+        return
+
+    snapshot = [
+        SearchDocument(id=str(document.id), body=_searchable_payload(document.body))
+        for document in documents
+    ]
+    if snapshot:
+        background_tasks.add_task(_index_documents, client, snapshot, index)
+
+
+def _index_documents(client: OpenSearch, documents: list[SearchDocument], index: str) -> None:
+    """Background task body for add_objects_to_index_later"""
+    try:
+        add_objects_to_index(client, documents, index)
+    except Exception:
+        # As in _index_payload: the rows are committed, /reindex can resync
+        logger.exception("Failed to bulk index %d documents into %s", len(documents), index)
+
+
 def delete_index(client: OpenSearch, index: str) -> None:
     """
     Delete an OpenSearch index.
@@ -126,6 +219,27 @@ def reset_index(client: OpenSearch, index: str) -> None:
     client.indices.create(index=index, ignore=400)
 
 
+@contextmanager
+def bulk_load_index(client: OpenSearch, index: str) -> Iterator[None]:
+    """
+    Disable periodic refreshes on an index while it is being bulk loaded.
+
+    Refreshing segments during a full reindex is wasted work since nothing
+    should search the half-built index; the default interval is restored
+    and a single refresh issued when the block exits.
+    """
+    client.indices.put_settings(
+        index=index, body={"index": {"refresh_interval": "-1"}}
+    )
+    try:
+        yield
+    finally:
+        client.indices.put_settings(
+            index=index, body={"index": {"refresh_interval": None}}
+        )
+        client.indices.refresh(index=index)
+
+
 def search(
     client: OpenSearch, session: Session, query: str, n_results: int = 5
 ) -> SearchResponse:
@@ -3,9 +3,16 @@ Services for managing settings
 """
 from fastapi import HTTPException, status
 from sqlmodel import select
+from core.cache import TTLCache
+from core.config import get_settings
 from core.deps import SessionDep
 from api.settings.models import Setting, SettingUpdate
 
+# Setting values keyed by setting key; TTL comes from SETTINGS_CACHE_TTL and
+# entries are dropped when a setting is updated through this process
+_setting_value_cache = TTLCache(maxsize=256)
+_CACHE_MISS = object()
+
 
 def get_setting(session: SessionDep, key: str) -> Setting:
     """Get a specific setting by key"""
@@ -42,6 +49,7 @@ def update_setting(
     session.add(setting)
     session.commit()
     session.refresh(setting)
+    _setting_value_cache.pop(key)
 
     return setting
 
@@ -98,3 +106,33 @@ def get_setting_value(
         pass
 
     return None
+
+
+def get_cached_setting_value(
+    session: SessionDep,
+    key: str
+) -> str | None:
+    """
+    Like get_setting_value, but cached per process for SETTINGS_CACHE_TTL seconds.
+
+    Use this on hot paths that read rarely-changing settings on every request.
+    Updates made through update_setting are visible immediately in this
+    process; other workers see them once their cached entry expires.
+
+    Args:
+        session: Database session
+        key: Setting key to retrieve
+
+    Returns:
+        Setting value string or None if not found
+    """
+    value = _setting_value_cache.get(key, _CACHE_MISS)
+    if value is _CACHE_MISS:
+        value = get_setting_value(session, key)
+        _setting_value_cache.set(key, value, get_settings().SETTINGS_CACHE_TTL)
+    return value
+
+
+def clear_setting_value_cache() -> None:
+    """Drop all cached setting values"""
+    _setting_value_cache.clear()
@@ -24,13 +24,20 @@ def check_duplicate_attribute_keys(
         HTTPException: 400 with a detail listing the duplicate keys.
     """
     seen: set[str] = set()
-    keys = [attr.key for attr in attributes]
-    dups = [k for k in keys if k.lower() in seen or seen.add(k.lower())]
+    # Folded key -> the first repeat's spelling, so each duplicate is
+    # reported once however often it recurs
+    dups: dict[str, str] = {}
+    for attr in attributes:
+        folded = attr.key.lower()
+        if folded in seen:
+            dups.setdefault(folded, attr.key)
+        else:
+            seen.add(folded)
     if dups:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=(
-                f"Duplicate keys ({', '.join(dups)}) are not "
+                f"Duplicate keys ({', '.join(dups.values())}) are not "
                 f"allowed in {entity_name}."
             ),
         )
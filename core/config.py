@@ -177,6 +177,43 @@ class Settings(BaseSettings):
         """Build database URI from env or secrets, defaults to sqlite://"""
         return self._get_config_value("SQLALCHEMY_DATABASE_URI", default="sqlite://")
 
+    @computed_field
+    @property
+    def SQLALCHEMY_QUERY_CACHE_SIZE(self) -> int:
+        """
+        Entries in the engine's compiled-statement cache (SQLAlchemy's default
+        is 500). Size it above the number of distinct statements the app
+        issues so hot queries are not evicted and recompiled.
+        """
+        value = self._get_config_value("SQLALCHEMY_QUERY_CACHE_SIZE", default="1200")
+        return int(value)
+
+    @computed_field
+    @property
+    def SQLALCHEMY_POOL_SIZE(self) -> int:
+        """
+        Persistent connections per worker process (SQLAlchemy's default is 5).
+        Sync handlers each hold a connection, so keep the pool plus overflow
+        at or above SYNC_THREADPOOL_SIZE; otherwise handlers wait up to
+        SQLALCHEMY_POOL_TIMEOUT for a connection under full load.
+        """
+        value = self._get_config_value("SQLALCHEMY_POOL_SIZE", default="30")
+        return int(value)
+
+    @computed_field
+    @property
+    def SQLALCHEMY_MAX_OVERFLOW(self) -> int:
+        """Extra connections opened beyond the pool during spikes"""
+        value = self._get_config_value("SQLALCHEMY_MAX_OVERFLOW", default="10")
+        return int(value)
+
+    @computed_field
+    @property
+    def SQLALCHEMY_POOL_TIMEOUT(self) -> int:
+        """Seconds to wait for a free connection before raising"""
+        value = self._get_config_value("SQLALCHEMY_POOL_TIMEOUT", default="30")
+        return int(value)
+
     # ElasticSearch Configuration
     @computed_field
     @property
@@ -242,6 +279,52 @@ class Settings(BaseSettings):
         """Lambda function name that registers a workflow on AWS HealthOmics."""
         return self._get_config_value("OMICS_REGISTER_WORKFLOW_LAMBDA")
 
+    @computed_field
+    @property
+    def MANIFEST_CACHE_TTL(self) -> int:
+        """Seconds to cache latest-manifest lookups (<= 0 disables caching).
+
+        Kept short because manifests written to S3 outside the API are not
+        seen until the cached lookup expires.
+        """
+        value = self._get_config_value("MANIFEST_CACHE_TTL", default="5")
+        return int(value)
+
+    @computed_field
+    @property
+    def WORKFLOW_CONFIG_CACHE_TTL(self) -> int:
+        """Seconds to cache action/demux workflow configs read from S3 (<= 0 disables)"""
+        value = self._get_config_value("WORKFLOW_CONFIG_CACHE_TTL", default="60")
+        return int(value)
+
+    @computed_field
+    @property
+    def SYNC_THREADPOOL_SIZE(self) -> int:
+        """
+        Max sync route handlers running at once (AnyIO worker threads; AnyIO's
+        default is 40). Keep in step with the DB pool, as each handler holds a
+        connection while it runs.
+        """
+        value = self._get_config_value("SYNC_THREADPOOL_SIZE", default="40")
+        return int(value)
+
+    @computed_field
+    @property
+    def MAX_INFLIGHT(self) -> int:
+        """
+        Max requests a worker process handles at once; further requests queue
+        until one finishes (<= 0 disables the cap)
+        """
+        value = self._get_config_value("MAX_INFLIGHT", default="0")
+        return int(value)
+
+    @computed_field
+    @property
+    def SETTINGS_CACHE_TTL(self) -> int:
+        """Seconds to cache DB setting values per process (<= 0 disables caching)"""
+        value = self._get_config_value("SETTINGS_CACHE_TTL", default="60")
+        return int(value)
+
     # Options are from api.files.models.StorageBackend
     STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "s3")
     STORAGE_ROOT_PATH: str = os.getenv("STORAGE_URI", "s3://my-storage-bucket")
@@ -9,19 +9,24 @@ from core.config import get_settings
 # Get database URI
 database_uri = str(get_settings().SQLALCHEMY_DATABASE_URI)
 
+# Compiled SQL is cached per statement shape, so repeat queries skip compilation
+query_cache_size = get_settings().SQLALCHEMY_QUERY_CACHE_SIZE
+
 # Configure engine with connection pool settings for non-SQLite databases
 if database_uri.startswith('sqlite'):
     # SQLite: Use simple configuration (no pool parameters)
-    engine = create_engine(database_uri, echo=False)
+    engine = create_engine(database_uri, echo=False, query_cache_size=query_cache_size)
 else:
     # PostgreSQL/MySQL: Use connection pool with keep-alive settings
     engine = create_engine(
         database_uri,
         echo=False,
+        query_cache_size=query_cache_size,
         pool_pre_ping=True,      # Test connections before using them
         pool_recycle=3600,       # Recycle connections after 1 hour
-        pool_size=5,             # Number of connections in pool
-        max_overflow=10          # Max additional connections during spikes
+        pool_size=get_settings().SQLALCHEMY_POOL_SIZE,          # Connections in pool
+        max_overflow=get_settings().SQLALCHEMY_MAX_OVERFLOW,    # Extra during spikes
+        pool_timeout=get_settings().SQLALCHEMY_POOL_TIMEOUT,    # Wait for a connection
     )
 
 
@@ -3,6 +3,7 @@ Define functions/aliases for dependency injection
 """
 
 from collections.abc import Generator
+from functools import lru_cache
 from typing import Annotated, Any, TypeAlias
 from sqlmodel import Session
 from fastapi import Depends
@@ -33,11 +34,64 @@ def get_langgraph_client() -> Generator[Any, None, None]:
     yield client
 
 
+def get_aws_client_config():
+    """
+    Shared botocore client configuration.
+
+    Enlarges the HTTP connection pool (botocore defaults to 10) and keeps
+    connections alive so concurrent requests reuse TCP/TLS sessions. Retries
+    use adaptive mode, whose client-side rate limiter backs off on throttling
+    (e.g. S3 503 SlowDown during bursts of LIST/PUT) instead of failing fast.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=64,
+        tcp_keepalive=True,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    )
+
+
+@lru_cache(maxsize=None)
+def get_aws_client(
+    service_name: str,
+    region_name: str | None = None,
+    read_timeout: int | None = None,
+    retries: bool = True,
+):
+    """
+    Return a process-wide boto3 client for service_name/region_name.
+
+    Creating a client re-loads botocore's service model and endpoint data
+    and starts with a cold connection pool, so clients are built once and
+    shared; boto3 clients are thread-safe for API calls.
+
+    Args:
+        service_name: AWS service, e.g. "s3" or "lambda"
+        region_name: Optional region; defaults to the boto3 session's
+        read_timeout: Optional socket read timeout in seconds, for calls
+            that legitimately block longer than botocore's 60s default
+        retries: Set False for calls that must not be repeated, such as
+            invoking a Lambda with side effects; a read timeout would
+            otherwise be retried, running the function again
+    """
+    import boto3
+
+    from botocore.config import Config
+
+    config = get_aws_client_config()
+    if read_timeout is not None:
+        config = config.merge(Config(read_timeout=read_timeout))
+    if not retries:
+        config = config.merge(Config(retries={"total_max_attempts": 1}))
+
+    return boto3.client(service_name, region_name=region_name, config=config)
+
+
 def get_s3_client():
     """Get S3 client for dependency injection"""
     try:
-        import boto3
-        return boto3.client("s3")
+        return get_aws_client("s3")
     except ImportError:
         raise RuntimeError("boto3 is not available. Install it to use S3 features.")
 
@@ -4,6 +4,7 @@ Define application startup and shutdown procedures
 
 import os
 from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
 from sqlmodel import Session, select
 from core.config import get_settings
@@ -22,13 +23,15 @@ def sync_env_to_settings():
     Database is the source of truth - env vars are only used to populate missing values.
     """
     from api.settings.models import Setting
+    from api.settings.services import clear_setting_value_cache
 
     # List of setting keys to check
     setting_keys = [
         "DATA_BUCKET_URI",
         "RESULTS_BUCKET_URI",
         "DEMUX_WORKFLOW_CONFIGS_BUCKET_URI",
-        "MANIFEST_VALIDATION_LAMBDA"
+        "MANIFEST_VALIDATION_LAMBDA",
+        "MANIFEST_VALIDATION_RESULTS_URI",
     ]
 
     with Session(engine) as session:
@@ -51,6 +54,8 @@ def sync_env_to_settings():
 
         session.commit()
 
+    clear_setting_value_cache()
+
 
 # Handle startup/shutdown tasks
 @asynccontextmanager
@@ -96,7 +101,13 @@ async def lifespan(app: FastAPI):
         "LDAP_BASE_DN",
         "LDAP_USER_SEARCH_FILTER",
         "LDAP_USER_ATTRIBUTES",
-        "LDAP_TIMEOUT"
+        "LDAP_TIMEOUT",
+        "SYNC_THREADPOOL_SIZE",
+        "SQLALCHEMY_QUERY_CACHE_SIZE",
+        "SQLALCHEMY_POOL_SIZE",
+        "SQLALCHEMY_MAX_OVERFLOW",
+        "SQLALCHEMY_POOL_TIMEOUT",
+        "MAX_INFLIGHT",
     ]
     for key in computed_fields:
         value = getattr(settings, key)
@@ -106,6 +117,19 @@ async def lifespan(app: FastAPI):
     for key, value in vars(settings).items():
         _log_setting(key, value)
 
+    # Sync (def) route handlers are dispatched to AnyIO's worker threads; the
+    # limiter caps how many run concurrently
+    to_thread.current_default_thread_limiter().total_tokens = settings.SYNC_THREADPOOL_SIZE
+    db_connections = settings.SQLALCHEMY_POOL_SIZE + settings.SQLALCHEMY_MAX_OVERFLOW
+    if db_connections < settings.SYNC_THREADPOOL_SIZE:
+        logger.warning(
+            "SQLALCHEMY_POOL_SIZE + SQLALCHEMY_MAX_OVERFLOW (%d) is below "
+            "SYNC_THREADPOOL_SIZE (%d); under full load handlers will wait for "
+            "a database connection and may time out",
+            db_connections,
+            settings.SYNC_THREADPOOL_SIZE,
+        )
+
     # Sync environment variables to database settings
     logger.info("Syncing environment variables to database settings...")
     try:
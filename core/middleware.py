@@ -29,6 +29,7 @@ import time
 import uuid
 from typing import Any
 
+import anyio
 from fastapi import Request, Response
 from jose import JWTError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
@@ -216,6 +217,37 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class ConcurrencyLimitMiddleware:
+    """
+    Cap the requests a worker process handles at once.
+
+    Requests beyond max_inflight wait for a slot instead of starting work that
+    would only contend for the sync threadpool, the DB pool and the outbound
+    S3/OpenSearch connections. A max_inflight of 0 (or less) disables the cap.
+    The health check is never queued, so a busy worker is not reported dead.
+    """
+
+    def __init__(self, app: Any, max_inflight: int):
+        self.app = app
+        self.max_inflight = max_inflight
+        # Created on first use, inside the running event loop
+        self._semaphore: anyio.Semaphore | None = None
+
+    async def __call__(self, scope, receive, send):
+        if (
+            self.max_inflight <= 0
+            or scope["type"] != "http"
+            or scope["path"] in _UNLOGGED_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if self._semaphore is None:
+            self._semaphore = anyio.Semaphore(self.max_inflight)
+        async with self._semaphore:
+            await self.app(scope, receive, send)
+
+
 def _client_ip(request: Request) -> str | None:
     """
     Originating address.
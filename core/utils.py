@@ -1,3 +1,9 @@
+import base64
+import binascii
+import hashlib
+from functools import lru_cache
+
+from jinja2 import Template
 from jinja2.sandbox import SandboxedEnvironment
 
 # OpenSearch utilities ----
@@ -56,6 +62,69 @@ def interpolate(template_str: str, context: dict) -> str:
     Returns:
         Interpolated string with variables substituted
     """
-    env = SandboxedEnvironment()
-    template = env.from_string(template_str)
-    return template.render(context).strip()
+    return _compile_template(template_str).render(context).strip()
+
+
+# One sandbox for every template; environments are safe to share once configured
+_template_env = SandboxedEnvironment()
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template_str: str) -> Template:
+    """
+    Memoized sandboxed compile of a template string.
+
+    Pipeline and tool configs render the same handful of command, job name
+    and env templates on every submission, and compiling is far costlier than
+    rendering. Compiled templates are immutable and safe to render
+    concurrently. Syntax errors raise as from_string does (and are not cached).
+    """
+    return _template_env.from_string(template_str)
+
+
+# Pagination utilities ----
+
+
+def encode_cursor(value: str) -> str:
+    """
+    Encode the last-seen sort key of a page as an opaque keyset cursor.
+    """
+    return base64.urlsafe_b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by encode_cursor back to its sort key.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+# HTTP caching utilities ----
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Strong ETag for a response body.
+    """
+    return f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Whether an If-None-Match header value covers etag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    W/ prefix on either side is ignored.
+    """
+    if not if_none_match:
+        return False
+    candidates = {
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    }
+    return "*" in candidates or etag.removeprefix("W/") in candidates
@@ -14,7 +14,7 @@ from sqlmodel import Session
 from core.lifespan import lifespan
 from core.config import get_settings
 from core.db import engine
-from core.middleware import RequestContextMiddleware
+from core.middleware import ConcurrencyLimitMiddleware, RequestContextMiddleware
 
 from api.auth.routes import router as auth_router
 from api.auth.oauth_routes import router as oauth_router
@@ -116,6 +116,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Bound in-flight requests per worker. Registered before RequestContextMiddleware
+# so the access log's duration includes any time spent queued for a slot.
+app.add_middleware(ConcurrencyLimitMiddleware, max_inflight=get_settings().MAX_INFLIGHT)
+
 # Request id + structured access logging. Added AFTER CORSMiddleware, so it sits
 # OUTSIDE it: Starlette applies middleware in reverse registration order, so the
 # last added runs first. That is deliberate -- it means CORS preflight responses
@@ -126,7 +130,7 @@ app.add_middleware(RequestContextMiddleware)
 
 # Create a simple health check endpoint
 @app.get("/", tags=["index"])
-def root():
+async def root():
     return {"message": "Welcome to the NGS360 API! Visit /docs for API documentation."}
 
 
@@ -18,7 +18,7 @@ from api.runs.models import SequencingRun
 from api.samples.models import Sample  # noqa: F401
 from api.search.models import SearchDocument
 from api.runs.services import search_runs
-from api.search.services import add_objects_to_index
+from api.search.services import add_objects_to_index, bulk_load_index
 from api.qcmetrics.models import QCMetric, QCRecord  # noqa: F401
 
 
@@ -48,7 +48,8 @@ def reindex_sequencingruns(client, session, index="illumina_runs"):
 
     reset_index(client, index)
     # Bulk index all documents in one call
-    add_objects_to_index(client, search_docs, index)
+    with bulk_load_index(client, index):
+        add_objects_to_index(client, search_docs, index, refresh=False)
 
     logger.info(f"Reindexing completed. Total runs indexed: {len(runs)}")
 
@@ -67,7 +68,8 @@ def reindex_projects(client, session, index="projects"):
 
     reset_index(client, index)
     # Bulk index all documents in one call
-    add_objects_to_index(client, search_docs, index)
+    with bulk_load_index(client, index):
+        add_objects_to_index(client, search_docs, index, refresh=False)
 
     logger.info(f"Reindexing completed. Total projects indexed: {len(projects)}")
 
@@ -2,17 +2,27 @@
 Test /manifest endpoint
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
+from uuid import uuid4
 import io
+import json
 import pytest
 
-from fastapi import HTTPException
+from fastapi import HTTPException, UploadFile
 from fastapi.testclient import TestClient
 
-from api.manifest.services import get_latest_manifest_file
+from api.manifest import services as manifest_services
+from api.manifest.models import S3Path, parse_s3_path
+from api.manifest.services import (
+    _parse_validation_result,
+    get_latest_manifest_file,
+)
 
-from tests.conftest import MockS3Client
+from core import deps as core_deps
+from core.cache import TTLCache
+from core.config import get_settings
+from tests.conftest import MockS3Client, MockS3PageIterator
 
 
 class TestManifestServices:
@@ -218,6 +228,202 @@ class TestManifestServices:
                 get_latest_manifest_file(path, mock_s3_client)
             assert exc_info.value.status_code == 400
 
+    def test_get_latest_manifest_sharded_listing(self):
+        """Test that sub-prefixes are listed separately and reduced by date"""
+        listings = {
+            ("vendor/", "/"): [{
+                "Contents": [{
+                    "Key": "vendor/top_manifest.csv",
+                    "LastModified": datetime(2024, 1, 1, 12, 0, 0),
+                }],
+                "CommonPrefixes": [{"Prefix": "vendor/a/"}, {"Prefix": "vendor/b/"}],
+            }],
+            ("vendor/a/", None): [{
+                "Contents": [{
+                    "Key": "vendor/a/Manifest.csv",
+                    "LastModified": datetime(2024, 3, 1, 12, 0, 0),
+                }],
+            }],
+            ("vendor/b/", None): [
+                {
+                    "Contents": [{
+                        "Key": "vendor/b/Manifest.csv",
+                        "LastModified": datetime(2024, 2, 1, 12, 0, 0),
+                    }],
+                },
+                {},
+            ],
+        }
+
+        def paginate(Bucket, Prefix, Delimiter=None, **kwargs):
+            return MockS3PageIterator(listings[(Prefix, Delimiter)])
+
+        s3_client = MagicMock()
+        s3_client.get_paginator.return_value.paginate.side_effect = paginate
+
+        result = get_latest_manifest_file("s3://test-bucket/vendor/", s3_client)
+
+        assert result == "s3://test-bucket/vendor/a/Manifest.csv"
+        listed_prefixes = {
+            call.kwargs["Prefix"]
+            for call in s3_client.get_paginator.return_value.paginate.call_args_list
+        }
+        assert listed_prefixes == {"vendor/", "vendor/a/", "vendor/b/"}
+
+    def test_get_latest_manifest_date_pattern_stops_at_newest_date(self):
+        """Test that a date_pattern search lists recent dates newest first"""
+        today = datetime.now(timezone.utc)
+        two_days_ago = (today - timedelta(days=2)).strftime("%Y/%m/%d/")
+        older = (today - timedelta(days=5)).strftime("%Y/%m/%d/")
+        listings = {
+            f"vendor/{two_days_ago}": [{
+                "Contents": [{
+                    "Key": f"vendor/{two_days_ago}run_manifest.csv",
+                    "LastModified": datetime(2024, 1, 1, 12, 0, 0),
+                }],
+            }],
+            f"vendor/{older}": [{
+                "Contents": [{
+                    "Key": f"vendor/{older}run_manifest.csv",
+                    "LastModified": datetime(2024, 2, 1, 12, 0, 0),
+                }],
+            }],
+        }
+
+        def paginate(Bucket, Prefix, Delimiter=None, **kwargs):
+            return MockS3PageIterator(listings.get(Prefix, [{}]))
+
+        s3_client = MagicMock()
+        paginate_mock = s3_client.get_paginator.return_value.paginate
+        paginate_mock.side_effect = paginate
+
+        result = get_latest_manifest_file(
+            "s3://test-bucket/vendor", s3_client, date_pattern="%Y/%m/%d/"
+        )
+
+        assert result == f"s3://test-bucket/vendor/{two_days_ago}run_manifest.csv"
+        # Today, yesterday and two days ago; nothing older, no full listing
+        assert paginate_mock.call_count == 3
+
+    def test_get_latest_manifest_date_pattern_falls_back_to_full_scan(
+        self, mock_s3_client: MockS3Client
+    ):
+        """Test that a date_pattern search with no recent match lists everything"""
+        files = [{
+            "Key": "vendor/manifest.csv",
+            "LastModified": datetime(2024, 1, 1, 12, 0, 0),
+            "Size": 1024,
+        }]
+        mock_s3_client.setup_bucket("test-bucket", "vendor/", files, [])
+
+        result = get_latest_manifest_file(
+            "s3://test-bucket/vendor/", mock_s3_client, date_pattern="%Y/%m/%d/"
+        )
+
+        assert result == "s3://test-bucket/vendor/manifest.csv"
+
+    def test_get_latest_manifest_cached_until_upload(
+        self, mock_s3_client: MockS3Client, monkeypatch
+    ):
+        """Test lookups are cached per bucket/prefix and dropped on upload"""
+        monkeypatch.setenv("MANIFEST_CACHE_TTL", "60")
+        monkeypatch.setattr(manifest_services, "_latest_manifest_cache", TTLCache())
+
+        files = [
+            {
+                "Key": "vendor/Old_Manifest.csv",
+                "LastModified": datetime(2024, 1, 1, 12, 0, 0),
+                "Size": 1024,
+            }
+        ]
+        mock_s3_client.setup_bucket("test-bucket", "vendor/", files, [])
+
+        first = get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client)
+        assert first == "s3://test-bucket/vendor/Old_Manifest.csv"
+
+        # A newer file appearing without an upload through the API is not
+        # seen until the cached entry expires
+        files.append({
+            "Key": "vendor/New_Manifest.csv",
+            "LastModified": datetime(2024, 2, 1, 12, 0, 0),
+            "Size": 1024,
+        })
+        cached = get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client)
+        assert cached == first
+
+        # Uploading under the prefix invalidates the cached lookup
+        upload = UploadFile(
+            file=io.BytesIO(b"Sample_ID\nS001"), filename="Newest_Manifest.csv"
+        )
+        manifest_services.upload_manifest_file(
+            "s3://test-bucket/vendor/", upload, mock_s3_client
+        )
+        refreshed = get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client)
+        assert refreshed == "s3://test-bucket/vendor/New_Manifest.csv"
+
+    def test_get_latest_manifest_s3_upload_visible_after_ttl(
+        self, mock_s3_client: MockS3Client, monkeypatch
+    ):
+        """Test manifests written straight to S3 show up once the TTL expires"""
+        monkeypatch.setenv("MANIFEST_CACHE_TTL", "5")
+        monkeypatch.setattr(manifest_services, "_latest_manifest_cache", TTLCache())
+        now = [1000.0]
+        monkeypatch.setattr("core.cache.time.monotonic", lambda: now[0])
+
+        files = []
+        mock_s3_client.setup_bucket("test-bucket", "vendor/", files, [])
+
+        # "No manifest" is not cached, so the first manifest is seen at once
+        assert get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client) is None
+        files.append({
+            "Key": "vendor/Old_Manifest.csv",
+            "LastModified": datetime(2024, 1, 1, 12, 0, 0),
+            "Size": 1024,
+        })
+        first = get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client)
+        assert first == "s3://test-bucket/vendor/Old_Manifest.csv"
+
+        files.append({
+            "Key": "vendor/New_Manifest.csv",
+            "LastModified": datetime(2024, 2, 1, 12, 0, 0),
+            "Size": 1024,
+        })
+        now[0] += 4
+        assert get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client) == first
+
+        now[0] += 2
+        refreshed = get_latest_manifest_file("s3://test-bucket/vendor/", mock_s3_client)
+        assert refreshed == "s3://test-bucket/vendor/New_Manifest.csv"
+
+    def test_s3_path_parsing(self):
+        """Test S3Path exposes bucket and key and rejects malformed paths"""
+        path = S3Path("s3://test-bucket/vendor/manifest.csv")
+        assert path == "s3://test-bucket/vendor/manifest.csv"
+        assert (path.bucket, path.key) == ("test-bucket", "vendor/manifest.csv")
+
+        root = S3Path("s3://test-bucket")
+        assert (root.bucket, root.key) == ("test-bucket", "")
+
+        expected_errors = {
+            "http://bucket/path": "Must start with s3://",
+            "s3://": "Bucket name is required",
+            "s3:///bucket": "Bucket name cannot start with /",
+            "s3://bucket//path": "cannot contain double slashes",
+        }
+        for value, message in expected_errors.items():
+            with pytest.raises(ValueError, match=message):
+                S3Path(value)
+
+    def test_parse_s3_path_is_memoized(self):
+        """Test repeated paths reuse one parsed S3Path and errors still raise"""
+        first = parse_s3_path("s3://test-bucket/memo/")
+        assert parse_s3_path("s3://test-bucket/memo/") is first
+        assert (first.bucket, first.key) == ("test-bucket", "memo/")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Must start with s3://"):
+                parse_s3_path("bucket/memo/")
+
     def test_get_latest_manifest_no_credentials(self, mock_s3_client: MockS3Client):
         """Test error handling when AWS credentials are missing"""
         mock_s3_client.simulate_error("NoCredentialsError")
@@ -272,9 +478,8 @@ class TestManifestAPI:
 
         # Verify response
         assert response.status_code == 200
-        assert (
-            response.text == '"s3://test-bucket/vendor/manifests/Manifest_2024_02.csv"'
-        )
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == "s3://test-bucket/vendor/manifests/Manifest_2024_02.csv"
 
     def test_get_latest_manifest_no_content(
         self, client: TestClient, mock_s3_client: MockS3Client
@@ -416,6 +621,24 @@ class TestManifestUpload:
         # Verify file was uploaded with the path-specified name
         assert "manifests/custom_name.csv" in mock_s3_client.uploaded_files["test-bucket"]
 
+    def test_upload_manifest_streams_file_object(self):
+        """Test uploads stream the spooled file through a multipart transfer"""
+        s3_client = MagicMock()
+        body = io.BytesIO(b"Sample_ID\nS001")
+        body.read()  # Leave the stream at EOF, as a prior reader would
+        upload = UploadFile(file=body, filename="manifest.csv")
+
+        manifest_services.upload_manifest_file(
+            "s3://test-bucket/vendor/", upload, s3_client
+        )
+
+        s3_client.put_object.assert_not_called()
+        args, kwargs = s3_client.upload_fileobj.call_args
+        assert args == (body, "test-bucket", "vendor/manifest.csv")
+        assert kwargs["Config"] is manifest_services.MANIFEST_TRANSFER_CFG
+        assert kwargs["Config"].multipart_chunksize == 8 * 1024 * 1024
+        assert body.tell() == 0
+
     def test_upload_manifest_to_directory_without_trailing_slash(
         self, client: TestClient, mock_s3_client: MockS3Client
     ):
@@ -925,3 +1148,242 @@ class TestManifestValidation:
         # Verify files_bucket defaulted to bucket from s3_path
         last_payload = mock_lambda_client.invocations[-1]["Payload"]
         assert last_payload["manifest_uri"] == "s3://my-bucket/path/manifest.csv"
+
+    def test_validation_lambda_client_read_timeout(self, monkeypatch):
+        """Test synchronous validations use a Lambda client with a long read timeout"""
+        get_aws_client = MagicMock()
+        monkeypatch.setattr(manifest_services, "get_aws_client", get_aws_client)
+
+        manifest_services._invoke_validation_lambda("validator", {"manifest_uri": "x"})
+
+        get_aws_client.assert_called_once_with(
+            "lambda", get_settings().AWS_REGION,
+            read_timeout=manifest_services.MANIFEST_VALIDATION_READ_TIMEOUT,
+            retries=False,
+        )
+        invoke_kwargs = get_aws_client.return_value.invoke.call_args.kwargs
+        assert invoke_kwargs["Payload"] == b'{"manifest_uri":"x"}'
+
+    def test_validation_lambda_client_disables_retries(self):
+        """Test the validation Lambda client never re-invokes on a timeout"""
+        client = core_deps.get_aws_client(
+            "lambda", "us-east-1",
+            read_timeout=manifest_services.MANIFEST_VALIDATION_READ_TIMEOUT,
+            retries=False,
+        )
+
+        assert client.meta.config.retries["total_max_attempts"] == 1
+        assert (
+            client.meta.config.read_timeout
+            == manifest_services.MANIFEST_VALIDATION_READ_TIMEOUT
+        )
+        assert client is not core_deps.get_aws_client(
+            "lambda", "us-east-1",
+            read_timeout=manifest_services.MANIFEST_VALIDATION_READ_TIMEOUT,
+        )
+
+    def test_parse_validation_result_nested_body(self):
+        """Test API Gateway-style payloads with a JSON-string body"""
+        raw = (
+            b'{"statusCode": 200, "body": "{\\"validation_passed\\": true, '
+            b'\\"warnings\\": {\\"Sample\\": [\\"check\\"]}}"}'
+        )
+
+        result = _parse_validation_result(raw, function_error=False)
+
+        assert result.valid is True
+        assert result.warning == {"Sample": ["check"]}
+
+    def test_parse_validation_result_object_body(self):
+        """Test a body already emitted as an object is used without re-parsing"""
+        raw = b'{"statusCode": 200, "body": {"validation_passed": false, "errors": {"A": ["b"]}}}'
+
+        result = _parse_validation_result(raw, function_error=False)
+
+        assert result.valid is False
+        assert result.error == {"A": ["b"]}
+
+    def test_parse_validation_result_invalid_json(self):
+        """Test that an unparseable Lambda payload maps to a 500"""
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_validation_result(b"not json", function_error=False)
+
+        assert exc_info.value.status_code == 500
+        assert "Failed to parse" in exc_info.value.detail
+
+
+class TestManifestValidationJobs:
+    """Test fire-and-forget manifest validation endpoints"""
+
+    def test_submit_manifest_validation(
+        self, client: TestClient, mock_lambda_client
+    ):
+        """Test that submitting queues an Event invocation with a result location"""
+        response = client.post(
+            "/api/v1/manifest/validations?manifest_uri=s3://test-bucket/manifest.csv"
+            "&manifest_version=dts12.1"
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status"] == "pending"
+        assert data["result"] is None
+        assert data["result_uri"] == (
+            f"s3://test-results-bucket/manifest-validations/{data['job_id']}.json"
+        )
+
+        invocation = mock_lambda_client.invocations[-1]
+        assert invocation["InvocationType"] == "Event"
+        assert invocation["Payload"]["job_id"] == data["job_id"]
+        assert invocation["Payload"]["result_uri"] == data["result_uri"]
+        assert invocation["Payload"]["manifest_version"] == "DTS12.1"
+
+    def test_submit_manifest_validation_writes_marker(
+        self, client: TestClient, mock_lambda_client, mock_s3_client: MockS3Client
+    ):
+        """Test that submitting writes a "submitted" marker at the result location"""
+        data = client.post(
+            "/api/v1/manifest/validations?manifest_uri=s3://test-bucket/manifest.csv"
+        ).json()
+
+        marker = json.loads(
+            mock_s3_client.uploaded_files["test-results-bucket"][
+                f"manifest-validations/{data['job_id']}.json"
+            ]
+        )
+        assert marker["status"] == "submitted"
+        assert marker["job_id"] == data["job_id"]
+        assert marker["submitted_at"]
+
+    def test_submit_manifest_validation_lambda_error_removes_marker(
+        self, client: TestClient, mock_lambda_client, mock_s3_client: MockS3Client
+    ):
+        """Test that a failed invocation does not leave a pending marker behind"""
+        mock_lambda_client.simulate_error("ResourceNotFoundException")
+
+        response = client.post(
+            "/api/v1/manifest/validations?manifest_uri=s3://test-bucket/manifest.csv"
+        )
+
+        assert response.status_code == 404
+        assert not mock_s3_client.uploaded_files.get("test-results-bucket")
+
+    def test_get_manifest_validation_pending_then_complete(
+        self, client: TestClient, mock_lambda_client, mock_s3_client: MockS3Client
+    ):
+        """Test polling a job before and after the Lambda writes its result"""
+        job = client.post(
+            "/api/v1/manifest/validations?manifest_uri=s3://test-bucket/manifest.csv"
+        ).json()
+
+        response = client.get(f"/api/v1/manifest/validations/{job['job_id']}")
+        assert response.status_code == 200
+        assert response.json()["status"] == "pending"
+        assert response.json()["submitted_at"] is not None
+
+        mock_s3_client.put_object(
+            Bucket="test-results-bucket",
+            Key=f"manifest-validations/{job['job_id']}.json",
+            Body=b'{"validation_passed": false, "errors": {"Sample": ["missing"]}}',
+        )
+
+        response = client.get(f"/api/v1/manifest/validations/{job['job_id']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "complete"
+        assert data["result"]["valid"] is False
+        assert data["result"]["error"] == {"Sample": ["missing"]}
+
+    def test_get_manifest_validation_unknown_job(
+        self, client: TestClient, mock_s3_client: MockS3Client
+    ):
+        """Test that a job with neither a marker nor a result is a 404"""
+        response = client.get(f"/api/v1/manifest/validations/{uuid4()}")
+        assert response.status_code == 404
+
+    def test_get_manifest_validation_lambda_error(
+        self, client: TestClient, mock_lambda_client, mock_s3_client: MockS3Client
+    ):
+        """Test that an error written by the Lambda is reported as a failed job"""
+        job = client.post(
+            "/api/v1/manifest/validations?manifest_uri=s3://test-bucket/manifest.csv"
+        ).json()
+        mock_s3_client.put_object(
+            Bucket="test-results-bucket",
+            Key=f"manifest-validations/{job['job_id']}.json",
+            Body=b'{"success": false, "statusCode": 404, "error": "no such manifest"}',
+        )
+
+        response = client.get(f"/api/v1/manifest/validations/{job['job_id']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "failed"
+        assert data["result"] is None
+        assert "no such manifest" in data["error"]
+
+    def test_get_manifest_validation_stale_marker(
+        self, client: TestClient, mock_s3_client: MockS3Client
+    ):
+        """Test that a marker never replaced by a result eventually fails"""
+        job_id = str(uuid4())
+        submitted_at = (
+            datetime.now(timezone.utc)
+            - manifest_services.MANIFEST_VALIDATION_JOB_TIMEOUT
+            - timedelta(minutes=1)
+        )
+        mock_s3_client.put_object(
+            Bucket="test-results-bucket",
+            Key=f"manifest-validations/{job_id}.json",
+            Body=json.dumps({
+                "status": "submitted",
+                "job_id": job_id,
+                "submitted_at": submitted_at.isoformat(),
+            }).encode(),
+        )
+
+        response = client.get(f"/api/v1/manifest/validations/{job_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "failed"
+        assert data["error"]
+
+    def test_get_manifest_validation_non_object_result(
+        self, client: TestClient, mock_s3_client: MockS3Client
+    ):
+        """Test that a result that is not a JSON object is reported as failed"""
+        job_id = str(uuid4())
+        mock_s3_client.put_object(
+            Bucket="test-results-bucket",
+            Key=f"manifest-validations/{job_id}.json",
+            Body=b'["not", "an", "object"]',
+        )
+
+        response = client.get(f"/api/v1/manifest/validations/{job_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "failed"
+        assert "not a JSON object" in data["error"]
+
+    def test_manifest_validation_invalid_results_uri(
+        self, client: TestClient, mock_s3_client: MockS3Client, monkeypatch
+    ):
+        """Test that a non-S3 results location is reported, not a traceback"""
+        monkeypatch.setattr(
+            manifest_services, "get_cached_setting_value",
+            lambda session, key: "https://example.com/results",
+        )
+
+        response = client.get(f"/api/v1/manifest/validations/{uuid4()}")
+        assert response.status_code == 500
+        assert "MANIFEST_VALIDATION_RESULTS_URI" in response.json()["detail"]
+
+        response = client.post(
+            "/api/v1/manifest/validations?manifest_uri=s3://test-bucket/manifest.csv"
+        )
+        assert response.status_code == 500
+        assert "MANIFEST_VALIDATION_RESULTS_URI" in response.json()["detail"]
+
+    def test_get_manifest_validation_invalid_job_id(self, client: TestClient):
+        """Test that job IDs must be UUIDs"""
+        response = client.get("/api/v1/manifest/validations/not-a-job")
+        assert response.status_code == 422
@@ -50,6 +50,27 @@ def test_get_pipeline_platforms(client: TestClient):
     assert "SevenBridges" in platform_values
 
 
+def test_get_pipeline_options_etag(client: TestClient):
+    """Test action options/platforms carry an ETag and honour If-None-Match"""
+    for path in ("/api/v1/actions/options", "/api/v1/actions/platforms"):
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "public, max-age=300"
+
+        # The ETag is stable across requests
+        assert client.get(path).headers["ETag"] == etag
+
+        not_modified = client.get(path, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["ETag"] == etag
+
+        stale = client.get(path, headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.json() == response.json()
+
+
 @patch("api.actions.services.get_setting_value")
 def test_get_pipeline_types(
     mock_get_setting: MagicMock,
@@ -468,6 +489,128 @@ def test_get_all_configs_success(
         assert isinstance(config["platforms"], dict)
 
 
+@patch("api.actions.services.get_setting_value")
+def test_get_all_configs_skips_unreadable(
+    mock_get_setting: MagicMock,
+    client: TestClient,
+    session: Session,
+    mock_s3_client
+):
+    """Test concurrently loaded configs keep listing order and skip bad files"""
+    mock_get_setting.return_value = "s3://ngs360-resources/pipeline_configs/"
+
+    names = ["a_pipeline", "b_pipeline", "broken", "c_pipeline"]
+    files = [{"Key": f"pipeline_configs/{name}.yaml"} for name in names]
+    mock_s3_client.setup_bucket("ngs360-resources", "pipeline_configs/", files, [])
+    mock_s3_client.uploaded_files["ngs360-resources"] = {
+        f"pipeline_configs/{name}.yaml": yaml.dump({
+            "project_type": name,
+            "project_admins": [],
+            "platforms": {"Arvados": {"launchers": "launcher"}},
+        }).encode("utf-8")
+        for name in names
+    }
+    mock_s3_client.uploaded_files["ngs360-resources"][
+        "pipeline_configs/broken.yaml"
+    ] = b"project_type: [unclosed"
+
+    data = client.get("/api/v1/actions/configs").json()
+    assert data["total"] == 3
+    assert [c["project_type"] for c in data["configs"]] == [
+        "a_pipeline", "b_pipeline", "c_pipeline"
+    ]
+
+
+@patch("api.actions.services.get_setting_value")
+def test_get_all_configs_fetches_listed_keys(
+    mock_get_setting: MagicMock,
+    client: TestClient,
+    session: Session,
+    mock_s3_client,
+    monkeypatch,
+):
+    """Test each listed config is read with one GET of the key it was listed under"""
+    mock_get_setting.return_value = "s3://ngs360-resources/pipeline_configs/"
+
+    files = [
+        {"Key": "pipeline_configs/rna_pipeline.yml"},
+        {"Key": "pipeline_configs/wgs_pipeline.yml"},
+        {"Key": "pipeline_configs/wgs_pipeline.yaml"},
+    ]
+    mock_s3_client.setup_bucket("ngs360-resources", "pipeline_configs/", files, [])
+    mock_s3_client.uploaded_files["ngs360-resources"] = {
+        f["Key"]: yaml.dump({
+            "project_type": f["Key"].rsplit("/", 1)[1],
+            "project_admins": [],
+            "platforms": {"Arvados": {"launchers": "launcher"}},
+        }).encode("utf-8")
+        for f in files
+    }
+
+    requested = []
+    get_object = mock_s3_client.get_object
+
+    def recording_get_object(Bucket, Key, **kwargs):
+        requested.append(Key)
+        return get_object(Bucket=Bucket, Key=Key, **kwargs)
+
+    monkeypatch.setattr(mock_s3_client, "get_object", recording_get_object)
+
+    data = client.get("/api/v1/actions/configs").json()
+    assert [c["project_type"] for c in data["configs"]] == [
+        "rna_pipeline.yml", "wgs_pipeline.yaml"
+    ]
+    assert sorted(requested) == [
+        "pipeline_configs/rna_pipeline.yml", "pipeline_configs/wgs_pipeline.yaml"
+    ]
+
+    from api.actions.services import list_action_configs
+
+    assert list_action_configs(session, mock_s3_client) == ["rna_pipeline", "wgs_pipeline"]
+
+
+@patch("api.actions.services.get_setting_value")
+def test_get_all_configs_cached(
+    mock_get_setting: MagicMock,
+    client: TestClient,
+    session: Session,
+    mock_s3_client,
+    monkeypatch,
+):
+    """Test repeat config reads are served from the TTL cache, not S3"""
+    from api.actions import services as action_services
+    from core.cache import TTLCache
+
+    monkeypatch.setenv("WORKFLOW_CONFIG_CACHE_TTL", "60")
+    monkeypatch.setattr(action_services, "_action_config_cache", TTLCache())
+    mock_get_setting.return_value = "s3://ngs360-resources/pipeline_configs/"
+
+    files = [{"Key": "pipeline_configs/wgs_pipeline.yaml"}]
+    mock_s3_client.setup_bucket("ngs360-resources", "pipeline_configs/", files, [])
+    wgs_config = {
+        "project_type": "WGS",
+        "project_admins": [],
+        "platforms": {"SevenBridges": {"create_project_command": "launch-wgs"}},
+    }
+    mock_s3_client.uploaded_files["ngs360-resources"] = {
+        "pipeline_configs/wgs_pipeline.yaml": yaml.dump(wgs_config).encode("utf-8"),
+    }
+
+    response = client.get("/api/v1/actions/configs")
+    assert response.json()["total"] == 1
+
+    # Neither a new listing entry nor an edited body is read back until expiry
+    files.append({"Key": "pipeline_configs/rna_pipeline.yaml"})
+    wgs_config["project_type"] = "WGS-v2"
+    mock_s3_client.uploaded_files["ngs360-resources"][
+        "pipeline_configs/wgs_pipeline.yaml"
+    ] = yaml.dump(wgs_config).encode("utf-8")
+
+    data = client.get("/api/v1/actions/configs").json()
+    assert data["total"] == 1
+    assert data["configs"][0]["project_type"] == "WGS"
+
+
 @patch("api.actions.services.get_setting_value")
 def test_get_all_configs_empty(
     mock_get_setting: MagicMock,
@@ -504,3 +647,22 @@ def test_get_all_configs_s3_error(
     response = client.get("/api/v1/actions/configs")
     assert response.status_code == 404
     assert "bucket" in response.json()["detail"].lower()
+
+
+def test_platform_config_export_reference():
+    """Test export labels resolve through the map built when the config loads"""
+    from api.actions.models import PlatformConfig
+
+    platform_config = PlatformConfig(exports=[
+        {"Raw Counts": "raw_counts"},
+        {"Normalized": "normalized_counts"},
+        {"Raw Counts": "shadowed"},
+    ])
+    assert platform_config.export_reference("Raw Counts") == "raw_counts"
+    assert platform_config.export_reference("Normalized") == "normalized_counts"
+    assert platform_config.export_reference("Unknown") is None
+    assert PlatformConfig().export_reference("Raw Counts") is None
+
+    # Cached configs are handed out as deep copies
+    copied = platform_config.model_copy(deep=True)
+    assert copied.export_reference("Normalized") == "normalized_counts"
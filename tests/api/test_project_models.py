@@ -64,3 +64,18 @@ def test_actual_datetime_objects_pass_through():
     project = _make_project(created_at=now, last_modified=now)
     assert project.created_at == now
     assert project.last_modified == now
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM project WHERE project_id = 'P-20260101-0001'",
+        "SELECT * FROM projectattribute WHERE project_id = X'00'",
+        "SELECT * FROM projectattribute WHERE project_id = X'00' AND key = 'Department'",
+    ],
+)
+def test_project_lookups_are_index_backed(session, query):
+    """Project and attribute lookups seek an index rather than scanning."""
+    plan = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {query}").all()
+    details = " ".join(row[-1] for row in plan)
+    assert "USING INDEX" in details, details
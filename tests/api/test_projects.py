@@ -4,12 +4,18 @@ Test /projects endpoint
 """
 
 from unittest.mock import patch, MagicMock
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlalchemy import inspect as sa_inspect
+from sqlmodel import Session, select
 import yaml
 
+from api.project.deps import get_validated_project
 from api.project.models import Project, ProjectAttribute
 from api.project.services import generate_project_id
+from api.settings import services as settings_services
+from core.cache import TTLCache
 
 
 def _create_project(session: Session):
@@ -33,6 +39,7 @@ def test_get_projects_with_no_data(client: TestClient, session: Session):
         "per_page": 20,
         "has_next": False,
         "has_prev": False,
+        "next_cursor": None,
     }
 
 
@@ -75,6 +82,137 @@ def test_get_projects_with_data(client: TestClient, session: Session):
     assert attribute_dict["Priority"] == "High"
 
 
+def test_get_projects_with_cursor(client: TestClient, session: Session):
+    """Test that next_cursor walks every project exactly once"""
+    for _ in range(5):
+        _create_project(session)
+
+    seen = []
+    response = client.get("/api/v1/projects", params={"per_page": 2})
+    assert response.status_code == 200
+    page = response.json()
+    seen.extend(p["project_id"] for p in page["data"])
+    while page["next_cursor"]:
+        response = client.get(
+            "/api/v1/projects",
+            params={"per_page": 2, "cursor": page["next_cursor"]},
+        )
+        assert response.status_code == 200
+        page = response.json()
+        # Cursor pages skip the COUNT query
+        assert page["total_items"] is None
+        assert page["has_prev"] is True
+        seen.extend(p["project_id"] for p in page["data"])
+
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+    assert page["has_next"] is False
+
+
+def test_get_projects_cursor_errors(client: TestClient, session: Session):
+    """Test that a malformed cursor or a non-keyset sort is rejected"""
+    response = client.get("/api/v1/projects", params={"cursor": "not-a-cursor!"})
+    assert response.status_code == 400
+
+    response = client.get(
+        "/api/v1/projects", params={"cursor": "UDAwMDE", "sort_by": "created_by"}
+    )
+    assert response.status_code == 400
+
+    # A project_id cursor is not a name cursor
+    response = client.get(
+        "/api/v1/projects", params={"cursor": "UDAwMDE", "sort_by": "name"}
+    )
+    assert response.status_code == 400
+
+
+def test_get_projects_rejects_unknown_sort_field(client: TestClient):
+    """Test that sort_by is limited to the sortable columns"""
+    response = client.get("/api/v1/projects", params={"sort_by": "attributes"})
+    assert response.status_code == 422
+
+    response = client.get("/api/v1/projects", params={"sort_by": "created_at"})
+    assert response.status_code == 200
+
+
+def test_get_projects_with_name_cursor(client: TestClient, session: Session):
+    """Test that a name-sorted cursor walk breaks ties on project_id"""
+    for name in ["Beta", "Alpha", "Beta", "Gamma", "Alpha"]:
+        response = client.post("/api/v1/projects", json={"name": name, "attributes": []})
+        assert response.status_code == 201
+
+    params = {"per_page": 2, "sort_by": "name", "sort_order": "desc"}
+    page = client.get("/api/v1/projects", params=params).json()
+    seen = [(p["name"], p["project_id"]) for p in page["data"]]
+    while page["next_cursor"]:
+        response = client.get(
+            "/api/v1/projects", params={**params, "cursor": page["next_cursor"]}
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend((p["name"], p["project_id"]) for p in page["data"])
+
+    assert len(seen) == 5
+    assert seen == sorted(seen, reverse=True)
+
+
+def test_get_projects_loads_attributes_in_bulk(
+    client: TestClient, session: Session, record_statements
+):
+    """Test a page of projects costs the same number of queries whatever its size"""
+    def listing_statements():
+        with record_statements() as statements:
+            response = client.get("/api/v1/projects")
+        assert response.status_code == 200
+        return len(statements)
+
+    for i in range(2):
+        client.post("/api/v1/projects", json={
+            "name": f"Project {i}", "attributes": [{"key": "Index", "value": str(i)}]
+        })
+    two_projects = listing_statements()
+
+    for i in range(2, 6):
+        client.post("/api/v1/projects", json={
+            "name": f"Project {i}", "attributes": [{"key": "Index", "value": str(i)}]
+        })
+    assert listing_statements() == two_projects
+
+
+def test_get_projects_counts_with_the_page(client: TestClient, session: Session, record_statements):
+    """Test the total comes back with the page rows rather than a separate COUNT"""
+    for _ in range(3):
+        _create_project(session)
+
+    with record_statements() as statements:
+        response = client.get("/api/v1/projects", params={"per_page": 2})
+    assert response.status_code == 200
+    assert response.json()["total_items"] == 3
+    assert response.json()["total_pages"] == 2
+    assert not any(s.lstrip().startswith("SELECT count(*)") for s in statements)
+
+    # Past the last page the total is still reported
+    response = client.get("/api/v1/projects", params={"per_page": 2, "page": 5})
+    assert response.json()["data"] == []
+    assert response.json()["total_items"] == 3
+    assert response.json()["has_next"] is False
+
+
+def test_get_projects_caches_bucket_uris(
+    client: TestClient, session: Session, record_statements, monkeypatch
+):
+    """Test the folder URI roots are read from the settings cache, not per request"""
+    monkeypatch.setenv("SETTINGS_CACHE_TTL", "60")
+    monkeypatch.setattr(settings_services, "_setting_value_cache", TTLCache())
+    client.post("/api/v1/projects", json={"name": "Project", "attributes": []})
+
+    with record_statements() as statements:
+        response = client.get("/api/v1/projects")
+    assert response.status_code == 200
+    assert response.json()["data"][0]["data_folder_uri"].startswith("s3://")
+    assert not any("setting" in statement.lower() for statement in statements)
+
+
 def test_get_projects_attributes(client: TestClient, session: Session):
     """Test that we get a full list of all attributes across all projects"""
     # Add two projects with different attributes
@@ -348,6 +486,49 @@ def test_create_project_strips_whitespace_from_attribute(client: TestClient):
         assert attr["value"] == attr["value"].strip()
 
 
+def test_create_project_does_not_reload(client: TestClient, session: Session, record_statements):
+    """Test the create response is built without reading the new rows back"""
+    with record_statements() as statements:
+        response = client.post("/api/v1/projects", json={
+            "name": "Fresh", "attributes": [{"key": "Tier", "value": "1"}]
+        })
+    assert response.status_code == 201
+    assert response.json()["attributes"] == [{"key": "Tier", "value": "1"}]
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    # Only the project_id MAX lookup (and settings) touch the database
+    assert not any("projectattribute" in s or "project.created_by" in s for s in selects)
+
+
+def test_create_project_duplicate_attribute_keys(client: TestClient):
+    """Test that each case-insensitively repeated key is reported once"""
+    response = client.post("/api/v1/projects", json={
+        "name": "Duplicates",
+        "attributes": [
+            {"key": "Tier", "value": "1"},
+            {"key": "tier", "value": "2"},
+            {"key": "TIER", "value": "3"},
+            {"key": "Owner", "value": "a"},
+        ],
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "Duplicate keys (tier) are not allowed in project attributes."
+    )
+
+
+def test_create_project_rejects_duplicate_keys_before_writing(
+    client: TestClient, session: Session, record_statements
+):
+    """Test duplicate attribute keys are rejected before the project is inserted"""
+    with record_statements() as statements:
+        response = client.post("/api/v1/projects", json={
+            "name": "Duplicates",
+            "attributes": [{"key": "Tier", "value": "1"}, {"key": "tier", "value": "2"}],
+        })
+    assert response.status_code == 400
+    assert not any("project" in s for s in statements)
+
+
 def test_generate_project_id(session: Session):
     """Test that we can generate a project id"""
     # Generate a project id
@@ -371,6 +552,40 @@ def test_generate_project_id(session: Session):
     assert project_id.endswith("0002")
 
 
+def test_create_project_steps_past_taken_project_id(client: TestClient, session: Session):
+    """Test a project_id taken by a concurrent create moves on to the next suffix"""
+    first = client.post("/api/v1/projects", json={"name": "First"}).json()["project_id"]
+    second = client.post("/api/v1/projects", json={"name": "Second"}).json()["project_id"]
+
+    # Simulate a create that read the maximum before the other two committed
+    with patch("api.project.services.generate_project_id", return_value=first):
+        response = client.post(
+            "/api/v1/projects",
+            json={"name": "Third", "attributes": [{"key": "Tier", "value": "1"}]},
+        )
+    assert response.status_code == 201
+    third = response.json()["project_id"]
+    assert third.rsplit("-", 1)[0] == first.rsplit("-", 1)[0]
+    assert int(third.rsplit("-", 1)[1]) == int(second.rsplit("-", 1)[1]) + 1
+    assert response.json()["attributes"] == [{"key": "Tier", "value": "1"}]
+
+    project = session.exec(select(Project).where(Project.project_id == third)).one()
+    assert project.name == "Third"
+    assert len(session.exec(select(Project)).all()) == 3
+
+
+def test_create_project_gives_up_on_project_id_after_attempts(
+    client: TestClient, session: Session
+):
+    """Test create_project stops retrying once every candidate project_id is taken"""
+    first = client.post("/api/v1/projects", json={"name": "First"}).json()["project_id"]
+    with patch("api.project.services.PROJECT_ID_ATTEMPTS", 1), \
+            patch("api.project.services.generate_project_id", return_value=first):
+        response = client.post("/api/v1/projects", json={"name": "Second"})
+    assert response.status_code == 409
+    assert len(session.exec(select(Project)).all()) == 1
+
+
 def test_get_project(client: TestClient, session: Session):
     """Test GET /api/projects/<project_id> works in different scenarios"""
     # Test when project not found and db is empty
@@ -398,6 +613,63 @@ def test_get_project(client: TestClient, session: Session):
     assert response_json["project_id"] == new_project.project_id
 
 
+def test_validated_project_eager_loads_relationships(session: Session):
+    """Test ProjectDep loads attributes up front and leaves samples lazy"""
+    project = Project(name="Test Project", created_by="testuser")
+    project.project_id = generate_project_id(session=session)
+    project.attributes = [ProjectAttribute(key="Department", value="R&D")]
+    session.add(project)
+    session.commit()
+    project_id = project.project_id
+    session.expunge_all()
+
+    loaded = get_validated_project(project_id=project_id, session=session)
+    assert "attributes" not in sa_inspect(loaded).unloaded
+    assert "samples" in sa_inspect(loaded).unloaded
+    assert [attr.key for attr in loaded.attributes] == ["Department"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_validated_project(project_id="P-00000000-0000", session=session)
+    assert exc_info.value.status_code == 404
+
+
+def test_get_project_selects_project_once(client: TestClient, session: Session, record_statements):
+    """Test the project loaded by ProjectDep is reused rather than fetched again"""
+    _create_project(session)
+    project_id = session.exec(select(Project)).one().project_id
+
+    with record_statements() as statements:
+        response = client.get(f"/api/v1/projects/{project_id}")
+
+    assert response.status_code == 200
+    project_selects = [
+        s for s in statements if "FROM project \nWHERE project.project_id" in s
+    ]
+    assert len(project_selects) == 1
+
+
+def test_get_project_etag(client: TestClient, session: Session):
+    """Test GET /projects/{project_id} honours If-None-Match until the project changes"""
+    _create_project(session)
+    project_id = session.exec(select(Project)).one().project_id
+    url = f"/api/v1/projects/{project_id}"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-cache"
+    etag = response.headers["ETag"]
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.put(url, json={"name": "Renamed Project"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["name"] == "Renamed Project"
+    assert changed.headers["ETag"] != etag
+
+
 def test_update_project_name(client: TestClient, session: Session):
     """Test that we can update a project's name"""
     # Create a project
@@ -590,6 +862,56 @@ def test_update_project_replaces_all_attributes(client: TestClient, session: Ses
     assert "Status" not in attribute_dict  # This attribute was deleted
 
 
+def test_update_project_deletes_attributes_in_one_statement(
+    client: TestClient, session: Session, record_statements
+):
+    """Test replacing attributes deletes the old ones with a single bulk DELETE"""
+    new_project = Project(name="Test Project", created_by="testuser")
+    new_project.project_id = generate_project_id(session=session)
+    new_project.attributes = [
+        ProjectAttribute(key=f"Key{i}", value=str(i)) for i in range(3)
+    ]
+    session.add(new_project)
+    session.commit()
+
+    with record_statements() as statements:
+        response = client.put(
+            f"/api/v1/projects/{new_project.project_id}",
+            json={"attributes": [{"key": "Department", "value": "Engineering"}]},
+        )
+    assert response.status_code == 200
+    assert response.json()["attributes"] == [
+        {"key": "Department", "value": "Engineering"}
+    ]
+    # One statement keyed on the project, not a row-by-row delete of loaded attributes
+    deletes = [s for s in statements if s.lstrip().startswith("DELETE")]
+    assert len(deletes) == 1
+    assert "projectattribute.project_id" in deletes[0]
+    assert "projectattribute.id" not in deletes[0]
+
+
+@pytest.mark.parametrize("method", ["put", "patch"])
+def test_update_project_does_not_reload(
+    client: TestClient, session: Session, record_statements, method
+):
+    """Test the update response is built without reading the project back"""
+    project_id = client.post("/api/v1/projects", json={
+        "name": "Before", "attributes": [{"key": "Tier", "value": "1"}]
+    }).json()["project_id"]
+
+    with record_statements() as statements:
+        response = getattr(client, method)(f"/api/v1/projects/{project_id}", json={
+            "name": "After", "attributes": [{"key": "Tier", "value": "2"}]
+        })
+    assert response.status_code == 200
+    assert response.json()["name"] == "After"
+    assert response.json()["attributes"] == [{"key": "Tier", "value": "2"}]
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    # Only the project dependency loads the project and its attributes
+    assert len([s for s in selects if "FROM project " in s]) == 1
+    assert len([s for s in selects if "FROM projectattribute" in s]) == 1
+
+
 def test_update_project_removes_all_attributes(client: TestClient, session: Session):
     """Test that updating with empty attributes list removes all attributes"""
     # Create a project with attributes
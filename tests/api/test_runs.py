@@ -1148,6 +1148,54 @@ tags:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    def test_get_demux_workflow_config_cached(
+        self, client: TestClient, session: Session, mock_s3_client, monkeypatch
+    ):
+        """Test configs are served from the TTL cache without leaking run defaults"""
+        from api.runs import services as run_services
+        from core.cache import TTLCache
+
+        monkeypatch.setenv("WORKFLOW_CONFIG_CACHE_TTL", "60")
+        monkeypatch.setattr(run_services, "_demux_workflow_config_cache", TTLCache())
+
+        tool_config_yaml = """
+version: 1
+workflow_id: cached-tool
+workflow_name: {name}
+workflow_description: Cached tool
+inputs:
+  - name: s3_run_folder_path
+    desc: S3 Run Folder Path
+    type: String
+    required: true
+help: Cached tool
+tags:
+  - name: illumina_run
+"""
+        mock_s3_client.put_object(
+            Bucket="test-tool-configs-bucket",
+            Key="cached-tool.yaml",
+            Body=tool_config_yaml.format(name="First").encode("utf-8"),
+        )
+        config = run_services.get_demux_workflow_config(
+            session=session, workflow_id="cached-tool", s3_client=mock_s3_client
+        )
+        assert config.workflow_name == "First"
+        config.inputs[0].default = "s3://run-specific/"
+
+        # An edit in S3 is not seen until the entry expires, and mutating
+        # a returned config does not touch the cached copy
+        mock_s3_client.put_object(
+            Bucket="test-tool-configs-bucket",
+            Key="cached-tool.yaml",
+            Body=tool_config_yaml.format(name="Second").encode("utf-8"),
+        )
+        config = run_services.get_demux_workflow_config(
+            session=session, workflow_id="cached-tool", s3_client=mock_s3_client
+        )
+        assert config.workflow_name == "First"
+        assert config.inputs[0].default is None
+
     def test_get_demux_workflow_config_invalid_yaml(self, client: TestClient, mock_s3_client):
         """Test retrieving a demux workflow config with invalid YAML"""
         # Use YAML with unclosed bracket to ensure parse error
@@ -1,5 +1,7 @@
 """Unit tests for api.samples.parsing — CSV/TSV file → SampleCreate parsing."""
 
+import io
+
 import pytest
 
 from api.samples.parsing import parse_sample_file
@@ -273,3 +275,30 @@ class TestEncodingHandling:
         assert result[0].sample_id == "S001"
         attrs = {a.key: a.value for a in result[0].attributes}
         assert attrs["Tissue"] == "Lébér"
+
+
+# ---------------------------------------------------------------------------
+# File-object input
+# ---------------------------------------------------------------------------
+
+
+class TestFileObjectInput:
+    """Verify parsing straight from an uploaded file object."""
+
+    def test_parse_file_object_spanning_chunks(self):
+        """Test that a file larger than the sniffed head is parsed in full
+        and left open for the caller."""
+        rows = "".join(f"S{i:05d},Tissue {i}\n" for i in range(2000))
+        stream = io.BytesIO(("\n\nSampleID,Tissue\n" + rows).encode())
+        result = parse_sample_file(stream, "samples.csv")
+        assert len(result) == 2000
+        assert result[-1].sample_id == "S01999"
+        assert {a.key: a.value for a in result[-1].attributes} == {"Tissue": "Tissue 1999"}
+        assert not stream.closed
+
+    def test_parse_file_object_latin1_fallback(self):
+        """Test that a non-UTF-8 file object is re-read as Latin-1."""
+        content = "SampleID,Tissue\nS001,Lébér\n".encode("latin-1")
+        result = parse_sample_file(io.BytesIO(content), "test.csv")
+        attrs = {a.key: a.value for a in result[0].attributes}
+        assert attrs["Tissue"] == "Lébér"
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from sqlmodel import Session, select
 from fastapi.testclient import TestClient
 
@@ -37,6 +39,7 @@ def test_get_samples_for_a_project_with_no_samples(
         "limit": 100,
         "has_next": False,
         "has_prev": False,
+        "next_cursor": None,
     }
 
 
@@ -133,6 +136,91 @@ def test_get_samples_for_a_project_with_samples(client: TestClient, session: Ses
             assert condition_attr["value"] == "Disease"
 
 
+def test_get_samples_for_a_project_with_cursor(client: TestClient, session: Session):
+    """
+    Test that next_cursor pages through a project's samples in order
+    """
+    new_project = _create_project(session)
+    for i in range(5):
+        session.add(Sample(sample_id=f"Sample_{i}", project_id=new_project.project_id))
+    session.commit()
+
+    url = f"/api/v1/projects/{new_project.project_id}/samples"
+    response = client.get(url, params={"limit": 2, "sort_order": "desc"})
+    assert response.status_code == 200
+    page = response.json()
+    assert page["total_items"] == 5
+    seen = [s["sample_id"] for s in page["data"]]
+    while page["next_cursor"]:
+        response = client.get(
+            url,
+            params={"limit": 2, "sort_order": "desc", "cursor": page["next_cursor"]},
+        )
+        assert response.status_code == 200
+        page = response.json()
+        assert page["total_items"] is None
+        seen.extend(s["sample_id"] for s in page["data"])
+
+    assert seen == [f"Sample_{i}" for i in reversed(range(5))]
+
+    response = client.get(
+        url, params={"cursor": page["data"][0]["sample_id"], "sort_by": "created_at"}
+    )
+    assert response.status_code == 400
+
+
+def test_get_samples_timestamp_sort_is_stable(client: TestClient, session: Session):
+    """
+    Test that samples sharing a timestamp are ordered by sample_id, so offset
+    pages neither repeat nor skip any
+    """
+    new_project = _create_project(session)
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in (3, 0, 4, 1, 2):
+        session.add(Sample(
+            sample_id=f"Sample_{i}", project_id=new_project.project_id, created_at=created_at
+        ))
+    session.commit()
+
+    url = f"/api/v1/projects/{new_project.project_id}/samples"
+    seen = []
+    for skip in (0, 2, 4):
+        response = client.get(
+            url, params={"skip": skip, "limit": 2, "sort_by": "created_at", "sort_order": "desc"}
+        )
+        assert response.status_code == 200
+        seen.extend(s["sample_id"] for s in response.json()["data"])
+
+    assert seen == [f"Sample_{i}" for i in reversed(range(5))]
+
+
+def test_get_samples_counts_with_the_page(client: TestClient, session: Session, record_statements):
+    """
+    Test the project's sample total comes back with the page rows rather
+    than from a separate COUNT
+    """
+    new_project = _create_project(session)
+    other_project = _create_project(session, name="Other Project")
+    for i in range(3):
+        session.add(Sample(sample_id=f"Sample_{i}", project_id=new_project.project_id))
+    session.add(Sample(sample_id="Other", project_id=other_project.project_id))
+    session.commit()
+
+    url = f"/api/v1/projects/{new_project.project_id}/samples"
+    with record_statements() as statements:
+        response = client.get(url, params={"limit": 2})
+    assert response.status_code == 200
+    assert response.json()["total_items"] == 3
+    assert response.json()["has_next"] is True
+    assert not any(s.lstrip().startswith("SELECT count(*)") for s in statements)
+
+    # Past the last sample the total is still reported
+    response = client.get(url, params={"skip": 5, "limit": 2})
+    assert response.json()["data"] == []
+    assert response.json()["total_items"] == 3
+    assert response.json()["has_next"] is False
+
+
 def test_add_sample_to_project(client: TestClient, session: Session):
     """
     Test that we can add a sample to a project
@@ -323,6 +411,38 @@ def test_update_sample_attribute(client: TestClient, session: Session):
     )
 
 
+def test_update_sample_attribute_does_not_reload(
+    client: TestClient, session: Session, record_statements
+):
+    """
+    Test a sample attribute update answers from the rows it wrote, adding new
+    keys and adopting the incoming casing of existing ones
+    """
+    new_project = _create_project(session, name="Test Project")
+    session.add(Sample(
+        sample_id="Sample_1",
+        project_id=new_project.project_id,
+        attributes=[SampleAttribute(key="Tissue", value="Liver")],
+    ))
+    session.commit()
+
+    url = f"/api/v1/projects/{new_project.project_id}/samples/Sample_1"
+    with record_statements() as statements:
+        response = client.put(url, json={"key": "tissue", "value": "Lung"})
+    assert response.status_code == 200
+    assert response.json()["attributes"] == [{"key": "tissue", "value": "Lung"}]
+    # The sample and its attributes are each read once, before the write
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len([s for s in selects if "FROM sample " in s]) == 1
+    assert len([s for s in selects if "FROM sampleattribute" in s]) == 1
+
+    response = client.put(url, json={"key": "Condition", "value": "Healthy"})
+    assert response.json()["attributes"] == [
+        {"key": "tissue", "value": "Lung"},
+        {"key": "Condition", "value": "Healthy"},
+    ]
+
+
 # ---------------------------------------------------------------------------
 # ?include=files tests
 # ---------------------------------------------------------------------------
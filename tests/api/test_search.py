@@ -2,9 +2,28 @@
 Test /search endpoint
 """
 
+from unittest.mock import MagicMock, patch
+
+import anyio
+import pytest
+from fastapi import BackgroundTasks, HTTPException
 from fastapi.testclient import TestClient
 from opensearchpy import OpenSearch
-
+from opensearchpy.exceptions import (
+    ConnectionError as OpenSearchConnectionError,
+    TransportError,
+)
+from sqlmodel import Session
+
+from api.project.services import reindex_projects, search_projects
+from api.samples.services import reindex_samples
+from api.project.models import Project
+from api.search.models import SearchDocument
+from api.search.services import (
+    BULK_CHUNK_SIZE,
+    add_object_to_index_later,
+    add_objects_to_index_later,
+)
 from tests.fixtures.test_projects import basic_projects
 
 
@@ -30,6 +49,7 @@ def test_search_projects_no_projects(client: TestClient):
         "per_page": 20,
         "has_next": False,
         "has_prev": False,
+        "next_cursor": None,
     }
 
 
@@ -321,3 +341,188 @@ def test_search_returns_samples(client: TestClient):
         assert sample["project_id"] == project_id
         assert sample["attributes"] is not None
         assert len(sample["attributes"]) == 2
+
+
+def test_search_projects_trims_opensearch_response(session: Session):
+    """
+    Project search asks OpenSearch for just the total and the hit project_ids
+    """
+    os_client = MagicMock()
+    os_client.search.return_value = {"hits": {"total": {"value": 0}}}
+
+    result = search_projects(session, os_client, query="AI", page=1, per_page=20)
+
+    assert result.total_items == 0
+    kwargs = os_client.search.call_args.kwargs
+    assert kwargs["body"]["_source"] == ["project_id"]
+    assert kwargs["filter_path"] == [
+        "hits.total.value",
+        "hits.hits._source.project_id",
+        "hits.hits.sort",
+    ]
+
+
+def test_search_projects_cursor(client: TestClient):
+    """
+    Following next_cursor walks the search results with search_after
+    """
+    for project in basic_projects:
+        response = client.post("/api/v1/projects", json=project)
+        assert response.status_code == 201
+
+    url = "/api/v1/projects/search"
+    params = {"query": "*", "page": 1, "per_page": 1}
+    response = client.get(url, params=params)
+    assert response.status_code == 200
+    first = response.json()
+    assert first["data"][0]["name"] == "Test project 1"
+    assert first["next_cursor"] is not None
+
+    names = [first["data"][0]["name"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        response = client.get(url, params={"query": "*", "per_page": 1, "cursor": cursor})
+        assert response.status_code == 200
+        page = response.json()
+        assert page["current_page"] is None
+        assert page["has_prev"] is True
+        names.extend(project["name"] for project in page["data"])
+        cursor = page["next_cursor"]
+        assert page["has_next"] is (cursor is not None)
+
+    assert names == ["Test project 1", "Test project 2", "Test project 3"]
+
+    response = client.get(url, params={"query": "*", "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_search_projects_opensearch_errors(session: Session):
+    """
+    An unreachable cluster is a 503 with Retry-After; other OpenSearch
+    failures stay 500s
+    """
+    os_client = MagicMock()
+    os_client.search.side_effect = OpenSearchConnectionError("N/A", "timed out", None)
+    with pytest.raises(HTTPException) as exc_info:
+        search_projects(session, os_client, query="AI", page=1, per_page=20)
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+    os_client.search.side_effect = TransportError(400, "parse_exception", {})
+    with pytest.raises(HTTPException) as exc_info:
+        search_projects(session, os_client, query="AI", page=1, per_page=20)
+    assert exc_info.value.status_code == 500
+
+
+@patch("api.search.services.helpers.bulk")
+def test_reindex_projects_bulk_load(mock_bulk, client: TestClient, session: Session):
+    """
+    Reindexing streams projects into chunked bulk requests with refresh
+    disabled, then restores the refresh interval and refreshes exactly once
+    """
+    for name in ("Project A", "Project B"):
+        client.post("/api/v1/projects", json={"name": name, "attributes": []})
+
+    indexed = []
+
+    def consume(client, actions, **kwargs):
+        indexed.extend(actions)
+        return len(indexed), []
+
+    mock_bulk.side_effect = consume
+
+    os_client = MagicMock()
+    os_client.indices.exists.return_value = False
+    reindex_projects(session, os_client)
+
+    assert [a["_source"]["name"] for a in indexed] == ["Project A", "Project B"]
+    assert mock_bulk.call_args.kwargs["chunk_size"] == BULK_CHUNK_SIZE
+
+    settings_calls = os_client.indices.put_settings.call_args_list
+    assert [c.kwargs["body"]["index"]["refresh_interval"] for c in settings_calls] == [
+        "-1",
+        None,
+    ]
+    os_client.indices.refresh.assert_called_once_with(index="projects")
+
+
+@patch("api.search.services.helpers.bulk", return_value=(0, []))
+def test_reindex_samples_batches(mock_bulk, client: TestClient, session: Session):
+    """
+    Sample reindexing sends one bulk call per batch and covers every sample
+    """
+    response = client.post("/api/v1/projects", json={"name": "P", "attributes": []})
+    project_id = response.json()["project_id"]
+    for i in range(5):
+        client.post(
+            f"/api/v1/projects/{project_id}/samples", json={"sample_id": f"S{i}"}
+        )
+
+    os_client = MagicMock()
+    os_client.indices.exists.return_value = False
+    reindex_samples(session, os_client, batch_size=2)
+
+    batches = [list(c.args[1]) for c in mock_bulk.call_args_list]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert sorted(a["_source"]["sample_id"] for b in batches for a in b) == [
+        f"S{i}" for i in range(5)
+    ]
+
+
+def test_add_object_to_index_later():
+    """
+    Deferred indexing snapshots the document now, indexes it once the
+    background tasks run, and only logs an OpenSearch failure
+    """
+    os_client = MagicMock()
+    project = Project(project_id="P-1", name="Deferred", created_by="testuser")
+    tasks = BackgroundTasks()
+
+    add_object_to_index_later(
+        tasks, os_client, SearchDocument(id="P-1", body=project), index="projects"
+    )
+    project.name = "Changed"
+    os_client.index.assert_not_called()
+
+    anyio.run(tasks)
+    os_client.index.assert_called_once_with(
+        index="projects", id="P-1", body={"project_id": "P-1", "name": "Deferred"}
+    )
+
+    os_client.index.side_effect = RuntimeError("cluster unavailable")
+    tasks = BackgroundTasks()
+    add_object_to_index_later(
+        tasks, os_client, SearchDocument(id="P-1", body=project), index="projects"
+    )
+    anyio.run(tasks)
+
+
+@patch("api.search.services.helpers.bulk")
+def test_add_objects_to_index_later(mock_bulk):
+    """Deferred bulk indexing sends the snapshotted payloads in one bulk call"""
+    indexed = []
+
+    def consume(client, actions, **kwargs):
+        indexed.extend(actions)
+        return len(indexed), []
+
+    mock_bulk.side_effect = consume
+    os_client = MagicMock()
+    projects = [
+        Project(project_id=f"P-{i}", name=f"Project {i}", created_by="testuser")
+        for i in range(3)
+    ]
+    tasks = BackgroundTasks()
+
+    add_objects_to_index_later(
+        tasks,
+        os_client,
+        (SearchDocument(id=p.project_id, body=p) for p in projects),
+        index="projects",
+    )
+    mock_bulk.assert_not_called()
+
+    anyio.run(tasks)
+    assert mock_bulk.call_count == 1
+    assert [a["_id"] for a in indexed] == ["P-0", "P-1", "P-2"]
+    assert indexed[0]["_source"] == {"project_id": "P-0", "name": "Project 0"}
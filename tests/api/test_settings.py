@@ -2,7 +2,9 @@
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+from api.settings import services as settings_services
 from api.settings.models import Setting
+from core.cache import TTLCache
 
 
 def test_get_setting_by_key(client: TestClient, session: Session):
@@ -267,3 +269,26 @@ def test_get_setting_still_open_to_authenticated_users(
     response = client.get("/api/v1/settings/READ_TEST")
     assert response.status_code == 200
     assert response.json()["value"] == "readable"
+
+
+def test_cached_setting_value_invalidated_on_update(
+    superuser_client: TestClient, session: Session, monkeypatch
+):
+    """Cached setting values are reused until the setting is updated"""
+    monkeypatch.setenv("SETTINGS_CACHE_TTL", "60")
+    monkeypatch.setattr(settings_services, "_setting_value_cache", TTLCache())
+    session.add(Setting(key="CACHED_TEST", value="first", name="Cached Test"))
+    session.commit()
+
+    assert settings_services.get_cached_setting_value(session, "CACHED_TEST") == "first"
+
+    # A write that bypasses update_setting is not seen until the TTL expires
+    setting = session.get(Setting, "CACHED_TEST")
+    setting.value = "direct"
+    session.add(setting)
+    session.commit()
+    assert settings_services.get_cached_setting_value(session, "CACHED_TEST") == "first"
+
+    response = superuser_client.put("/api/v1/settings/CACHED_TEST", json={"value": "second"})
+    assert response.status_code == 200
+    assert settings_services.get_cached_setting_value(session, "CACHED_TEST") == "second"
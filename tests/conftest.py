@@ -1,12 +1,14 @@
 import os
+from contextlib import contextmanager
 import pytest
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import Session, create_engine, SQLModel
 from sqlmodel.pool import StaticPool
 
 from core.config import get_settings
-from core.deps import get_db, get_opensearch_client, get_s3_client
+from core.deps import get_aws_client, get_db, get_opensearch_client, get_s3_client
 from main import app
 
 
@@ -34,8 +36,16 @@ class MockOpenSearchClient:
             raise Exception(f"Document {id} not found in index {index}")
         return {"_id": id, "_index": index, "result": "not_found"}
 
-    def search(self, index: str, body: dict):
+    def search(self, index: str, body: dict, filter_path=None):
         """Mock search operation"""
+        response = self._search(index, body)
+        # Like OpenSearch, filter_path drops keys with nothing left under them
+        if filter_path and not response["hits"]["hits"]:
+            del response["hits"]["hits"]
+        return response
+
+    def _search(self, index: str, body: dict):
+        """Run the mock query and return a full search response"""
         if index not in self.documents:
             return {"hits": {"total": {"value": 0}, "hits": []}}
 
@@ -90,36 +100,43 @@ class MockOpenSearchClient:
             if should_include:
                 hits.append({"_id": doc_id, "_source": doc_body, "_score": 1.0})
 
-        # Apply sorting if specified
-        sort_config = body.get("sort", [])
-        if sort_config:
-            for sort_item in sort_config:
-                if isinstance(sort_item, dict):
-                    for field, sort_order in sort_item.items():
-                        order = (
-                            sort_order.get("order", "asc")
-                            if isinstance(sort_order, dict)
-                            else "asc"
-                        )
-                        reverse = order == "desc"
-
-                        # Sort by the specified field
-                        def get_sort_key(hit):
-                            source = hit.get("_source", {})
-                            # Remove .keyword suffix if present for compatibility with API
-                            base_field = field.split(".")[0] if "." in field else field
-                            value = source.get(base_field, "")
-                            # Convert to string for consistent sorting
-                            return str(value).lower() if value is not None else ""
-
-                        hits.sort(key=get_sort_key, reverse=reverse)
-                        break  # Only apply first sort for simplicity
-                    break
+        # Apply sorting if specified; every sort key is honoured and each hit
+        # carries its sort values, as OpenSearch returns them for search_after
+        sort_keys = []
+        for sort_item in body.get("sort", []):
+            if isinstance(sort_item, dict):
+                for field, sort_order in sort_item.items():
+                    order = (
+                        sort_order.get("order", "asc")
+                        if isinstance(sort_order, dict)
+                        else sort_order
+                    )
+                    # Remove .keyword suffix if present for compatibility with API
+                    sort_keys.append((field.split(".")[0], order == "desc"))
+
+        def sort_value(hit, base_field):
+            value = hit.get("_source", {}).get(base_field, "")
+            # Convert to string for consistent sorting
+            return str(value).lower() if value is not None else ""
+
+        for base_field, reverse in reversed(sort_keys):
+            hits.sort(key=lambda hit: sort_value(hit, base_field), reverse=reverse)
+        if sort_keys:
+            for hit in hits:
+                hit["sort"] = [sort_value(hit, base_field) for base_field, _ in sort_keys]
+
+        # Resume after the hit whose sort values match search_after
+        search_after = body.get("search_after")
+        if search_after is not None:
+            positions = [i for i, hit in enumerate(hits) if hit.get("sort") == search_after]
+            hits_after = hits[positions[0] + 1:] if positions else []
+        else:
+            hits_after = hits
 
         # Apply pagination
         from_param = body.get("from", 0)
         size_param = body.get("size", 10)
-        paginated_hits = hits[from_param:from_param + size_param]
+        paginated_hits = hits_after[from_param:from_param + size_param]
 
         return {"hits": {"total": {"value": len(hits)}, "hits": paginated_hits}}
 
@@ -233,6 +250,28 @@ class MockS3Paginator:
             yield page
 
 
+class MockS3PageIterator:
+    """Mock botocore PageIterator supporting iteration and JMESPath search"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __iter__(self):
+        return iter(self.pages)
+
+    def search(self, expression: str):
+        """Yield JMESPath results across pages, like PageIterator.search"""
+        import jmespath
+
+        compiled = jmespath.compile(expression)
+        for page in self.pages:
+            results = compiled.search(page)
+            if isinstance(results, list):
+                yield from results
+            elif results is not None:
+                yield results
+
+
 class MockS3Client:
     """Mock S3 client for testing"""
 
@@ -270,9 +309,11 @@ class MockS3Client:
                 def __init__(self, client):
                     self.client = client
 
-                def paginate(self, Bucket: str, Prefix: str, Delimiter: str = None):
+                def paginate(
+                    self, Bucket: str, Prefix: str, Delimiter: str = None, **kwargs
+                ):
                     paginator = MockS3Paginator(self.client, Bucket, Prefix, Delimiter)
-                    return paginator.paginate()
+                    return MockS3PageIterator(paginator.paginate())
 
             return PaginatorFactory(self)
 
@@ -361,13 +402,26 @@ class MockS3Client:
             }
             raise ClientError(error_response, "PutObject")
 
-        # Store the uploaded file
+        # Store the uploaded file (boto3 also accepts file-like bodies)
+        if hasattr(Body, "read"):
+            Body = Body.read()
         if Bucket not in self.uploaded_files:
             self.uploaded_files[Bucket] = {}
         self.uploaded_files[Bucket][Key] = Body
 
         return {"ETag": '"mock-etag"', "VersionId": "mock-version-id"}
 
+    def delete_object(self, Bucket: str, Key: str, **kwargs):
+        """Mock S3 delete_object operation"""
+        self.uploaded_files.get(Bucket, {}).pop(Key, None)
+        return {}
+
+    def upload_fileobj(
+        self, Fileobj, Bucket: str, Key: str, ExtraArgs=None, Callback=None, Config=None
+    ):
+        """Mock S3 upload_fileobj (managed transfer) operation"""
+        self.put_object(Bucket=Bucket, Key=Key, Body=Fileobj, **(ExtraArgs or {}))
+
     def generate_presigned_url(
         self, ClientMethod: str, Params: dict = None, ExpiresIn: int = 3600
     ):
@@ -550,6 +604,9 @@ def isolate_test_environment():
     os.environ["DATA_BUCKET_URI"] = "s3://test-data-bucket"
     os.environ["RESULTS_BUCKET_URI"] = "s3://test-results-bucket"
     os.environ["DEMUX_WORKFLOW_CONFIGS_BUCKET_URI"] = "s3://test-tool-configs-bucket"
+    os.environ["MANIFEST_CACHE_TTL"] = "0"  # Tests share bucket/prefix names
+    os.environ["SETTINGS_CACHE_TTL"] = "0"  # Each test seeds a fresh settings table
+    os.environ["WORKFLOW_CONFIG_CACHE_TTL"] = "0"  # Tests share config bucket names
 
     # Remove AWS credentials to prevent real AWS calls
     os.environ.pop("AWS_ACCESS_KEY_ID", None)
@@ -572,6 +629,14 @@ def reset_settings_cache():
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_aws_client_cache():
+    """Clear shared boto3 clients so per-test boto3.client patches apply"""
+    get_aws_client.cache_clear()
+    yield
+    get_aws_client.cache_clear()
+
+
 @pytest.fixture(name="session")
 def session_fixture():
     """Provide a fresh database session for each test"""
@@ -613,6 +678,12 @@ def session_fixture():
             name="Manifest Validation Lambda",
             description="Test Lambda function for manifest validation"
         ),
+        Setting(
+            key="MANIFEST_VALIDATION_RESULTS_URI",
+            value="s3://test-results-bucket/manifest-validations",
+            name="Manifest Validation Results URI",
+            description="Test location for asynchronous validation results"
+        ),
     ]
     for setting in test_settings:
         session.add(setting)
@@ -632,6 +703,29 @@ def session_fixture():
         engine.dispose()
 
 
+@pytest.fixture(name="record_statements")
+def record_statements_fixture(session: Session):
+    """
+    Provide a context manager that collects the SQL statements executed on
+    the test database within its block, for asserting query counts
+    """
+    @contextmanager
+    def record_statements():
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        bind = session.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+    return record_statements
+
+
 @pytest.fixture(name="mock_opensearch_client")
 def mock_opensearch_client_fixture():
     """Provide a mock OpenSearch client for testing"""
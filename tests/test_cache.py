@@ -0,0 +1,69 @@
+"""
+Tests for core in-process caching helpers
+"""
+
+from core import cache as cache_module
+from core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for the TTLCache used by service-level caches"""
+
+    def test_get_returns_cached_value(self):
+        """Test that a value set with a positive TTL is returned"""
+        cache = TTLCache()
+        cache.set("key", "value", ttl=60)
+        assert cache.get("key") == "value"
+
+    def test_get_missing_returns_default(self):
+        """Test the default is returned for unknown keys"""
+        cache = TTLCache()
+        sentinel = object()
+        assert cache.get("missing") is None
+        assert cache.get("missing", sentinel) is sentinel
+
+    def test_non_positive_ttl_disables_caching(self):
+        """Test that ttl <= 0 does not store anything"""
+        cache = TTLCache()
+        cache.set("key", "value", ttl=0)
+        cache.set("other", "value", ttl=-1)
+        assert len(cache) == 0
+
+    def test_entries_expire(self, monkeypatch):
+        """Test that entries are dropped once their TTL elapses"""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+        cache = TTLCache()
+        cache.set("key", "value", ttl=10)
+        now[0] += 9
+        assert cache.get("key") == "value"
+        now[0] += 2
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_maxsize_evicts_oldest(self):
+        """Test that the oldest entry is evicted when the cache is full"""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_pop_discard_where_and_clear(self):
+        """Test explicit invalidation helpers"""
+        cache = TTLCache()
+        for key in [("bucket", "a/"), ("bucket", "b/"), ("other", "a/")]:
+            cache.set(key, "value", ttl=60)
+
+        cache.pop(("bucket", "b/"))
+        assert cache.get(("bucket", "b/")) is None
+
+        cache.discard_where(lambda key: key[0] == "bucket")
+        assert cache.get(("bucket", "a/")) is None
+        assert cache.get(("other", "a/")) == "value"
+
+        cache.clear()
+        assert len(cache) == 0
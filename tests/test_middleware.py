@@ -3,11 +3,17 @@ import json
 import logging
 import uuid
 
+import anyio
 from fastapi.testclient import TestClient
 
 from core.config import get_settings
 from core.logger import JsonFormatter
-from core.middleware import REQUEST_ID_HEADER, _client_ip, _resolve_principal
+from core.middleware import (
+    REQUEST_ID_HEADER,
+    ConcurrencyLimitMiddleware,
+    _client_ip,
+    _resolve_principal,
+)
 from core.security import create_access_token
 
 
@@ -244,3 +250,42 @@ class TestEnvironmentSetting:
         monkeypatch.setenv("LOG_FORMAT", "xml")
         get_settings.cache_clear()
         assert get_settings().LOG_FORMAT == "json"
+
+
+class TestConcurrencyLimit:
+    """MAX_INFLIGHT queues requests beyond the cap rather than rejecting them"""
+
+    @staticmethod
+    def _run(max_inflight, paths):
+        state = {"active": 0, "peak": 0, "done": 0}
+
+        async def app(scope, receive, send):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await anyio.sleep(0.01)
+            state["active"] -= 1
+            state["done"] += 1
+
+        middleware = ConcurrencyLimitMiddleware(app, max_inflight=max_inflight)
+
+        async def main():
+            async with anyio.create_task_group() as tg:
+                for path in paths:
+                    tg.start_soon(middleware, {"type": "http", "path": path}, None, None)
+
+        anyio.run(main)
+        return state
+
+    def test_caps_concurrent_requests(self):
+        state = self._run(2, ["/api/v1/projects"] * 6)
+        assert state["peak"] == 2
+        assert state["done"] == 6
+
+    def test_disabled_by_default(self):
+        assert get_settings().MAX_INFLIGHT == 0
+        state = self._run(0, ["/api/v1/projects"] * 6)
+        assert state["peak"] == 6
+
+    def test_health_check_bypasses_the_cap(self):
+        state = self._run(1, ["/api/health"] * 3)
+        assert state["peak"] == 3
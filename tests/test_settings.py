@@ -85,3 +85,35 @@ def test_get_config_value_from_default():
         env_var_name='TEST_ENV_VAR',
         default='default_value')
     assert value == 'default_value'
+
+
+def test_sync_threadpool_size():
+    ''' Test the sync handler threadpool size defaults to AnyIO's and can be overridden '''
+    assert Settings().SYNC_THREADPOOL_SIZE == 40
+
+    with patch.dict('os.environ', {'SYNC_THREADPOOL_SIZE': '64'}):
+        assert Settings().SYNC_THREADPOOL_SIZE == 64
+
+
+def test_sqlalchemy_query_cache_size():
+    ''' Test the compiled-statement cache size has a default and can be overridden '''
+    assert Settings().SQLALCHEMY_QUERY_CACHE_SIZE == 1200
+
+    with patch.dict('os.environ', {'SQLALCHEMY_QUERY_CACHE_SIZE': '2000'}):
+        assert Settings().SQLALCHEMY_QUERY_CACHE_SIZE == 2000
+
+
+def test_sqlalchemy_pool_settings():
+    ''' Test the connection pool sizing has defaults and can be overridden '''
+    settings = Settings()
+    assert settings.SQLALCHEMY_POOL_SIZE == 30
+    assert settings.SQLALCHEMY_MAX_OVERFLOW == 10
+    assert settings.SQLALCHEMY_POOL_TIMEOUT == 30
+    # Every sync handler thread can hold a connection at once
+    assert (
+        settings.SQLALCHEMY_POOL_SIZE + settings.SQLALCHEMY_MAX_OVERFLOW
+        >= settings.SYNC_THREADPOOL_SIZE
+    )
+
+    with patch.dict('os.environ', {'SQLALCHEMY_POOL_SIZE': '50'}):
+        assert Settings().SQLALCHEMY_POOL_SIZE == 50
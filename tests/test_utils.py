@@ -179,6 +179,17 @@ class TestTemplateInterpolation:
         )
         assert result == expected
 
+    def test_interpolate_reuses_compiled_template(self):
+        """Test a template is compiled once and rendered with each call's context"""
+        from core.utils import _compile_template
+
+        template = "run --project {{projectid}} --reuse-check"
+        _compile_template.cache_clear()
+        assert interpolate(template, {"projectid": "P-1"}) == "run --project P-1 --reuse-check"
+        assert interpolate(template, {"projectid": "P-2"}) == "run --project P-2 --reuse-check"
+        info = _compile_template.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
 
 class TestSearchBodyBuilder:
     """Tests for OpenSearch query body builder"""
@@ -249,3 +260,25 @@ class TestSearchBodyBuilder:
         assert "(*RNA*)" in query_string
         assert "(*Seq*)" in query_string
         assert "(*analysis*)" in query_string
+
+
+class TestETags:
+    """Tests for the conditional-GET helpers"""
+
+    def test_make_etag_is_stable_and_quoted(self):
+        """Test the same body always yields the same quoted tag"""
+        from core.utils import make_etag
+
+        assert make_etag(b"{}") == make_etag(b"{}")
+        assert make_etag(b"{}") != make_etag(b"[]")
+        assert make_etag(b"{}").startswith('"') and make_etag(b"{}").endswith('"')
+
+    def test_etag_matches(self):
+        """Test If-None-Match lists, wildcards and weak tags"""
+        from core.utils import etag_matches
+
+        assert not etag_matches(None, '"a"')
+        assert not etag_matches('"b"', '"a"')
+        assert etag_matches('"b", "a"', '"a"')
+        assert etag_matches("*", '"a"')
+        assert etag_matches('W/"a"', '"a"')